@@ -1,5 +1,12 @@
-from .grpc_client import EnSyncClient as EnSyncEngine
+from .grpc_client import EnSyncClient as EnSyncEngine, get_engine
 from .websocket import EnSyncClient as EnSyncWebSocketEngine
 
 # gRPC is the default, WebSocket is an alternative
-__all__ = ['EnSyncEngine', 'EnSyncWebSocketEngine']
+__all__ = ['EnSyncEngine', 'EnSyncWebSocketEngine', 'get_engine']
+
+# grpclib transport is optional and only available when grpclib is installed
+try:
+    from .grpclib_client import EnSyncGrpclibClient as EnSyncGrpclibEngine
+    __all__.append('EnSyncGrpclibEngine')
+except ImportError:
+    pass
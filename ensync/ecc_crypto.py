@@ -9,6 +9,10 @@ from typing import Dict, List, Tuple, Union, Any
 
 import nacl.secret
 import nacl.utils
+from nacl.bindings import (
+    crypto_box, crypto_box_keypair, crypto_box_open, crypto_secretbox,
+    crypto_sign_ed25519_pk_to_curve25519, crypto_sign_ed25519_sk_to_curve25519
+)
 from nacl.public import PrivateKey, PublicKey, Box
 
 
@@ -33,84 +37,105 @@ def _decode_base64(data: Union[str, bytes]) -> bytes:
     return data
 
 
-def encrypt_ed25519(message: bytes, public_key: Union[str, bytes]) -> Dict[str, str]:
+def to_curve25519_public_key(public_key: Union[str, bytes]) -> PublicKey:
     """
-    Encrypt a message using Ed25519 public key.
+    Convert an Ed25519 public key to the Curve25519 key used for encryption.
     
     Args:
-        message: The message to encrypt
-        public_key: Recipient's Ed25519 public key (base64 string or bytes) - 32 bytes
+        public_key: Ed25519 public key (base64 string or bytes) - 32 bytes
         
     Returns:
-        Dict containing nonce, ciphertext, and ephemeral public key
+        Curve25519 PublicKey, reusable across encrypt_ed25519 calls
     """
     # Decode public key if it's base64
     if isinstance(public_key, str):
         public_key = base64.b64decode(public_key)
     
-    # Convert Ed25519 public key to Curve25519 public key
-    from nacl.bindings import crypto_sign_ed25519_pk_to_curve25519
-    curve25519_public_key = crypto_sign_ed25519_pk_to_curve25519(public_key)
+    return PublicKey(crypto_sign_ed25519_pk_to_curve25519(public_key))
+
+
+def to_curve25519_private_key(private_key: Union[str, bytes]) -> PrivateKey:
+    """
+    Convert an Ed25519 private key to the Curve25519 key used for decryption.
     
-    # Create ephemeral key pair
-    ephemeral_private = PrivateKey.generate()
-    ephemeral_public = ephemeral_private.public_key
+    Args:
+        private_key: Recipient's private key (base64 string or bytes) - can be 32 or 64 bytes
+        
+    Returns:
+        Curve25519 PrivateKey, reusable across decrypt_ed25519 calls
+    """
+    # Decode private key if it's base64
+    if isinstance(private_key, str):
+        private_key = base64.b64decode(private_key)
     
-    # Create box for encryption
-    recipient_public = PublicKey(curve25519_public_key)
-    box = Box(ephemeral_private, recipient_public)
+    # A 64-byte key is an Ed25519 keypair and has to be converted to Curve25519;
+    # a 32-byte key is already a Curve25519 secret key
+    if len(private_key) == 64:
+        private_key = crypto_sign_ed25519_sk_to_curve25519(private_key)
+    elif len(private_key) != 32:
+        raise ValueError(f"Private key must be 32 or 64 bytes, got {len(private_key)} bytes")
     
-    # Generate nonce and encrypt
+    return PrivateKey(private_key)
+
+
+def encrypt_ed25519(message: bytes, public_key: Union[str, bytes, PublicKey]) -> Dict[str, str]:
+    """
+    Encrypt a message using Ed25519 public key.
+    
+    Args:
+        message: The message to encrypt
+        public_key: Recipient's Ed25519 public key (base64 string or bytes) - 32 bytes,
+            or a Curve25519 PublicKey already converted with to_curve25519_public_key
+        
+    Returns:
+        Dict containing nonce, ciphertext, and ephemeral public key
+    """
+    # Convert Ed25519 public key to Curve25519 public key unless the caller did already
+    if isinstance(public_key, PublicKey):
+        recipient_public = public_key
+    else:
+        recipient_public = to_curve25519_public_key(public_key)
+    
+    # Create ephemeral key pair
+    ephemeral_public, ephemeral_private = crypto_box_keypair()
+    
+    # Generate nonce and encrypt; the bindings skip the Box/EncryptedMessage wrappers,
+    # which matter for the small message keys of hybrid encryption
     nonce = nacl.utils.random(Box.NONCE_SIZE)
-    ciphertext = box.encrypt(message, nonce).ciphertext
+    ciphertext = crypto_box(message, nonce, bytes(recipient_public), ephemeral_private)
     
     # Return as dictionary with base64 encoded values
     return {
         'nonce': base64.b64encode(nonce).decode('utf-8'),
         'ciphertext': base64.b64encode(ciphertext).decode('utf-8'),
-        'ephemeralPublicKey': base64.b64encode(bytes(ephemeral_public)).decode('utf-8')
+        'ephemeralPublicKey': base64.b64encode(ephemeral_public).decode('utf-8')
     }
 
 
-def decrypt_ed25519(encrypted_data: Dict[str, str], private_key: Union[str, bytes]) -> str:
+def decrypt_ed25519(encrypted_data: Dict[str, str], private_key: Union[str, bytes, PrivateKey]) -> str:
     """
     Decrypt a message using Ed25519 private key.
     
     Args:
         encrypted_data: Dict with nonce, ciphertext, and ephemeral public key
-        private_key: Recipient's private key (base64 string or bytes) - can be 32 or 64 bytes
+        private_key: Recipient's private key (base64 string or bytes) - can be 32 or 64 bytes,
+            or a Curve25519 PrivateKey already converted with to_curve25519_private_key
         
     Returns:
         Decrypted message as string
     """
     try:
-        # Decode private key if it's base64
-        if isinstance(private_key, str):
-            private_key = base64.b64decode(private_key)
-        
-        # If the key is 64 bytes (Ed25519 keypair), extract the first 32 bytes (seed)
-        # and convert to Curve25519 secret key
-        if len(private_key) == 64:
-            # Extract the 32-byte seed from the 64-byte Ed25519 secret key
-            ed25519_seed = private_key[:32]
-            # Convert Ed25519 seed to Curve25519 secret key using nacl
-            from nacl.bindings import crypto_sign_ed25519_sk_to_curve25519
-            private_key = crypto_sign_ed25519_sk_to_curve25519(private_key)
-        elif len(private_key) != 32:
-            raise ValueError(f"Private key must be 32 or 64 bytes, got {len(private_key)} bytes")
+        # Convert the private key to Curve25519 unless the caller did already
+        if not isinstance(private_key, PrivateKey):
+            private_key = to_curve25519_private_key(private_key)
         
         # Decode encrypted data components
         nonce = base64.b64decode(encrypted_data['nonce'])
         ciphertext = base64.b64decode(encrypted_data['ciphertext'])
         ephemeral_public_key = base64.b64decode(encrypted_data['ephemeralPublicKey'])
         
-        # Create box for decryption
-        recipient_private = PrivateKey(private_key)
-        sender_public = PublicKey(ephemeral_public_key)
-        box = Box(recipient_private, sender_public)
-        
         # Decrypt
-        decrypted = box.decrypt(ciphertext, nonce)
+        decrypted = crypto_box_open(ciphertext, nonce, ephemeral_public_key, bytes(private_key))
         return decrypted.decode('utf-8')
     except Exception as e:
         raise ValueError(f"Failed to decrypt: {str(e)}")
@@ -137,12 +162,9 @@ def encrypt_with_message_key(message: bytes, message_key: bytes) -> Dict[str, st
     Returns:
         Dict containing nonce and ciphertext
     """
-    # Create secret box with the message key
-    box = nacl.secret.SecretBox(message_key)
-    
-    # Generate nonce and encrypt
+    # Generate nonce and encrypt with the message key
     nonce = nacl.utils.random(nacl.secret.SecretBox.NONCE_SIZE)
-    ciphertext = box.encrypt(message, nonce).ciphertext
+    ciphertext = crypto_secretbox(message, nonce, message_key)
     
     # Return as dictionary with base64 encoded values
     return {
@@ -177,13 +199,13 @@ def decrypt_with_message_key(encrypted_data: Dict[str, str], message_key: bytes)
         raise ValueError(f"Failed to decrypt with message key: {str(e)}")
 
 
-def encrypt_message_key(message_key: bytes, public_key: Union[str, bytes]) -> Dict[str, str]:
+def encrypt_message_key(message_key: bytes, public_key: Union[str, bytes, PublicKey]) -> Dict[str, str]:
     """
     Encrypt a message key for a recipient using their public key.
     
     Args:
         message_key: The symmetric key to encrypt
-        public_key: Recipient's public key
+        public_key: Recipient's public key, or its converted Curve25519 PublicKey
         
     Returns:
         Dict containing encrypted key information
@@ -192,13 +214,13 @@ def encrypt_message_key(message_key: bytes, public_key: Union[str, bytes]) -> Di
     return encrypt_ed25519(message_key, public_key)
 
 
-def decrypt_message_key(encrypted_key: Dict[str, str], private_key: Union[str, bytes]) -> bytes:
+def decrypt_message_key(encrypted_key: Dict[str, str], private_key: Union[str, bytes, PrivateKey]) -> bytes:
     """
     Decrypt a message key using recipient's private key.
     
     Args:
         encrypted_key: Dict with encrypted key information
-        private_key: Recipient's private key
+        private_key: Recipient's private key, or its converted Curve25519 PrivateKey
         
     Returns:
         Decrypted message key as bytes
@@ -208,13 +230,16 @@ def decrypt_message_key(encrypted_key: Dict[str, str], private_key: Union[str, b
     return base64.b64decode(decrypted_key_base64)
 
 
-def hybrid_encrypt(message: bytes, recipient_public_keys: List[Union[str, bytes]]) -> Dict[str, Any]:
+def hybrid_encrypt(message: bytes, recipient_public_keys: List[Union[str, bytes]],
+                   curve25519_public_keys: List[PublicKey] = None) -> Dict[str, Any]:
     """
     Encrypt a message once with a symmetric key, then encrypt that key for each recipient.
     
     Args:
         message: The message to encrypt
         recipient_public_keys: List of recipient public keys
+        curve25519_public_keys: Optional converted keys of the same recipients, in the same
+            order, to skip the Ed25519 to Curve25519 conversion
         
     Returns:
         Dict with encrypted payload and keys for each recipient
@@ -227,9 +252,10 @@ def hybrid_encrypt(message: bytes, recipient_public_keys: List[Union[str, bytes]
     
     # Encrypt the message key for each recipient
     encrypted_keys = {}
-    for public_key_bytes in recipient_public_keys:
+    for i, public_key_bytes in enumerate(recipient_public_keys):
         public_key_hex = public_key_bytes.hex()
-        encrypted_key = encrypt_message_key(message_key, public_key_bytes)
+        encryption_key = curve25519_public_keys[i] if curve25519_public_keys else public_key_bytes
+        encrypted_key = encrypt_message_key(message_key, encryption_key)
         encrypted_keys[public_key_hex] = encrypted_key
     
     return {
@@ -0,0 +1,200 @@
+# Generated by the Protocol Buffers compiler. DO NOT EDIT!
+# source: ensync.proto
+# plugin: grpclib.plugin.main
+import abc
+import typing
+
+import grpclib.const
+import grpclib.client
+if typing.TYPE_CHECKING:
+    import grpclib.server
+
+from . import ensync_pb2
+
+
+class EnSyncServiceBase(abc.ABC):
+
+    @abc.abstractmethod
+    async def Connect(self, stream: 'grpclib.server.Stream[ensync_pb2.ConnectRequest, ensync_pb2.ConnectResponse]') -> None:
+        pass
+
+    @abc.abstractmethod
+    async def Heartbeat(self, stream: 'grpclib.server.Stream[ensync_pb2.HeartbeatRequest, ensync_pb2.HeartbeatResponse]') -> None:
+        pass
+
+    @abc.abstractmethod
+    async def PublishEvent(self, stream: 'grpclib.server.Stream[ensync_pb2.PublishEventRequest, ensync_pb2.PublishEventResponse]') -> None:
+        pass
+
+    @abc.abstractmethod
+    async def Subscribe(self, stream: 'grpclib.server.Stream[ensync_pb2.SubscribeRequest, ensync_pb2.EventStreamResponse]') -> None:
+        pass
+
+    @abc.abstractmethod
+    async def Unsubscribe(self, stream: 'grpclib.server.Stream[ensync_pb2.UnsubscribeRequest, ensync_pb2.UnsubscribeResponse]') -> None:
+        pass
+
+    @abc.abstractmethod
+    async def AcknowledgeEvent(self, stream: 'grpclib.server.Stream[ensync_pb2.AcknowledgeRequest, ensync_pb2.AcknowledgeResponse]') -> None:
+        pass
+
+    @abc.abstractmethod
+    async def DeferEvent(self, stream: 'grpclib.server.Stream[ensync_pb2.DeferRequest, ensync_pb2.DeferResponse]') -> None:
+        pass
+
+    @abc.abstractmethod
+    async def DiscardEvent(self, stream: 'grpclib.server.Stream[ensync_pb2.DiscardRequest, ensync_pb2.DiscardResponse]') -> None:
+        pass
+
+    @abc.abstractmethod
+    async def ReplayEvent(self, stream: 'grpclib.server.Stream[ensync_pb2.ReplayRequest, ensync_pb2.ReplayResponse]') -> None:
+        pass
+
+    @abc.abstractmethod
+    async def PauseEvents(self, stream: 'grpclib.server.Stream[ensync_pb2.PauseRequest, ensync_pb2.PauseResponse]') -> None:
+        pass
+
+    @abc.abstractmethod
+    async def ContinueEvents(self, stream: 'grpclib.server.Stream[ensync_pb2.ContinueRequest, ensync_pb2.ContinueResponse]') -> None:
+        pass
+
+    def __mapping__(self) -> typing.Dict[str, grpclib.const.Handler]:
+        return {
+            '/ensync.EnSyncService/Connect': grpclib.const.Handler(
+                self.Connect,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ensync_pb2.ConnectRequest,
+                ensync_pb2.ConnectResponse,
+            ),
+            '/ensync.EnSyncService/Heartbeat': grpclib.const.Handler(
+                self.Heartbeat,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ensync_pb2.HeartbeatRequest,
+                ensync_pb2.HeartbeatResponse,
+            ),
+            '/ensync.EnSyncService/PublishEvent': grpclib.const.Handler(
+                self.PublishEvent,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ensync_pb2.PublishEventRequest,
+                ensync_pb2.PublishEventResponse,
+            ),
+            '/ensync.EnSyncService/Subscribe': grpclib.const.Handler(
+                self.Subscribe,
+                grpclib.const.Cardinality.UNARY_STREAM,
+                ensync_pb2.SubscribeRequest,
+                ensync_pb2.EventStreamResponse,
+            ),
+            '/ensync.EnSyncService/Unsubscribe': grpclib.const.Handler(
+                self.Unsubscribe,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ensync_pb2.UnsubscribeRequest,
+                ensync_pb2.UnsubscribeResponse,
+            ),
+            '/ensync.EnSyncService/AcknowledgeEvent': grpclib.const.Handler(
+                self.AcknowledgeEvent,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ensync_pb2.AcknowledgeRequest,
+                ensync_pb2.AcknowledgeResponse,
+            ),
+            '/ensync.EnSyncService/DeferEvent': grpclib.const.Handler(
+                self.DeferEvent,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ensync_pb2.DeferRequest,
+                ensync_pb2.DeferResponse,
+            ),
+            '/ensync.EnSyncService/DiscardEvent': grpclib.const.Handler(
+                self.DiscardEvent,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ensync_pb2.DiscardRequest,
+                ensync_pb2.DiscardResponse,
+            ),
+            '/ensync.EnSyncService/ReplayEvent': grpclib.const.Handler(
+                self.ReplayEvent,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ensync_pb2.ReplayRequest,
+                ensync_pb2.ReplayResponse,
+            ),
+            '/ensync.EnSyncService/PauseEvents': grpclib.const.Handler(
+                self.PauseEvents,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ensync_pb2.PauseRequest,
+                ensync_pb2.PauseResponse,
+            ),
+            '/ensync.EnSyncService/ContinueEvents': grpclib.const.Handler(
+                self.ContinueEvents,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                ensync_pb2.ContinueRequest,
+                ensync_pb2.ContinueResponse,
+            ),
+        }
+
+
+class EnSyncServiceStub:
+
+    def __init__(self, channel: grpclib.client.Channel) -> None:
+        self.Connect = grpclib.client.UnaryUnaryMethod(
+            channel,
+            '/ensync.EnSyncService/Connect',
+            ensync_pb2.ConnectRequest,
+            ensync_pb2.ConnectResponse,
+        )
+        self.Heartbeat = grpclib.client.UnaryUnaryMethod(
+            channel,
+            '/ensync.EnSyncService/Heartbeat',
+            ensync_pb2.HeartbeatRequest,
+            ensync_pb2.HeartbeatResponse,
+        )
+        self.PublishEvent = grpclib.client.UnaryUnaryMethod(
+            channel,
+            '/ensync.EnSyncService/PublishEvent',
+            ensync_pb2.PublishEventRequest,
+            ensync_pb2.PublishEventResponse,
+        )
+        self.Subscribe = grpclib.client.UnaryStreamMethod(
+            channel,
+            '/ensync.EnSyncService/Subscribe',
+            ensync_pb2.SubscribeRequest,
+            ensync_pb2.EventStreamResponse,
+        )
+        self.Unsubscribe = grpclib.client.UnaryUnaryMethod(
+            channel,
+            '/ensync.EnSyncService/Unsubscribe',
+            ensync_pb2.UnsubscribeRequest,
+            ensync_pb2.UnsubscribeResponse,
+        )
+        self.AcknowledgeEvent = grpclib.client.UnaryUnaryMethod(
+            channel,
+            '/ensync.EnSyncService/AcknowledgeEvent',
+            ensync_pb2.AcknowledgeRequest,
+            ensync_pb2.AcknowledgeResponse,
+        )
+        self.DeferEvent = grpclib.client.UnaryUnaryMethod(
+            channel,
+            '/ensync.EnSyncService/DeferEvent',
+            ensync_pb2.DeferRequest,
+            ensync_pb2.DeferResponse,
+        )
+        self.DiscardEvent = grpclib.client.UnaryUnaryMethod(
+            channel,
+            '/ensync.EnSyncService/DiscardEvent',
+            ensync_pb2.DiscardRequest,
+            ensync_pb2.DiscardResponse,
+        )
+        self.ReplayEvent = grpclib.client.UnaryUnaryMethod(
+            channel,
+            '/ensync.EnSyncService/ReplayEvent',
+            ensync_pb2.ReplayRequest,
+            ensync_pb2.ReplayResponse,
+        )
+        self.PauseEvents = grpclib.client.UnaryUnaryMethod(
+            channel,
+            '/ensync.EnSyncService/PauseEvents',
+            ensync_pb2.PauseRequest,
+            ensync_pb2.PauseResponse,
+        )
+        self.ContinueEvents = grpclib.client.UnaryUnaryMethod(
+            channel,
+            '/ensync.EnSyncService/ContinueEvents',
+            ensync_pb2.ContinueRequest,
+            ensync_pb2.ContinueResponse,
+        )
@@ -4,18 +4,30 @@ Provides functionality for connecting to EnSync service via gRPC, publishing and
 """
 import asyncio
 import base64
+import functools
+import itertools
 import json
 import logging
+import os
+import threading
 import time
-from typing import Any, Callable, Dict, List, Optional, Set
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple, Union
 from collections import OrderedDict
 
 import grpc
+from nacl.public import PrivateKey, PublicKey
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from .error import EnSyncError, GENERIC_MESSAGE
 from .ecc_crypto import (
     encrypt_ed25519, decrypt_ed25519, hybrid_encrypt, hybrid_decrypt,
-    decrypt_message_key, decrypt_with_message_key
+    decrypt_message_key, decrypt_with_message_key, to_curve25519_public_key,
+    to_curve25519_private_key
 )
 from ensync_core.payload_utils import get_payload_metadata
 
@@ -32,21 +44,81 @@ logger.setLevel(logging.CRITICAL + 1)  # Disable all logging by default
 logger.addHandler(logging.NullHandler())
 logger.propagate = False
 
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            data = orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # Types orjson does not handle (e.g. integers wider than 64 bits)
+            pass
+        else:
+            # orjson writes NaN and Infinity as null; json.dumps keeps them, so the
+            # payload received does not depend on whether orjson is installed
+            if b"null" not in data:
+                return data
+    return json.dumps(obj).encode('utf-8')
+
+
+def _loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON from str or UTF-8 bytes, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except ValueError:
+            # JSON extensions orjson rejects (e.g. NaN); json.loads reports real errors
+            pass
+    return json.loads(data)
+
+
 SERVICE_NAME = ""
 
+# Sessions shared by clients authenticating with the same access key:
+# access_key -> (client_id, client_hash, expires_at)
+_session_cache: Dict[str, Tuple[str, str, float]] = {}
+
+# Channel arguments applied to every grpcio channel; override or extend them with the
+# "channelOptions" option. Publish payloads can exceed gRPC's default 4MB message limit.
+DEFAULT_CHANNEL_OPTIONS = {
+    "grpc.max_send_message_length": 16 * 1024 * 1024,
+    "grpc.max_receive_message_length": 16 * 1024 * 1024,
+    "grpc.http2.write_buffer_size": 1024 * 1024,
+    "grpc.http2.bdp_probe": 1
+}
+
+# Values accepted by the "compression" option
+COMPRESSION_ALGORITHMS = {
+    "gzip": grpc.Compression.Gzip,
+    "deflate": grpc.Compression.Deflate
+}
+
+# Cached sessions closer than this to expiry (in seconds) are refreshed instead of reused
+SESSION_REFRESH_MARGIN = 30
+
+# Engines shared through get_engine(): (engine class, url, serialized options) -> engine
+_engine_cache: Dict[Tuple[type, str, str], "EnSyncClient"] = {}
+
 
 class SubscriptionHandler:
     """Wrapper for subscription handler with metadata."""
-    def __init__(self, handler: Callable, app_secret_key: Optional[str], auto_ack: bool):
+    def __init__(self, handler: Callable, app_secret_key: Optional[str], auto_ack: bool,
+                 batch_size: int = 1, max_delay_ms: float = 100):
         self.handler = handler
         self.app_secret_key = app_secret_key
         self.auto_ack = auto_ack
+        # With batch_size > 1 the handler receives lists of events instead of single events
+        self.batch_size = max(1, batch_size)
+        self.max_delay = max_delay_ms / 1000
+        self.pending_events = []
+        self.flush_task = None
 
 
 class GrpcSubscription:
     """Represents a gRPC subscription to an event."""
     
-    def __init__(self, event_name: str, client, app_secret_key: str = None, auto_ack: bool = True):
+    def __init__(self, event_name: str, client, app_secret_key: str = None, auto_ack: bool = True,
+                 batch_size: int = 1, max_delay_ms: float = 100):
         """
         Initialize a subscription.
         
@@ -55,11 +127,15 @@ class GrpcSubscription:
             client: The EnSyncGrpcClient instance
             app_secret_key: The secret key for decryption
             auto_ack: Whether to automatically acknowledge events
+            batch_size: Number of events delivered to handlers per call
+            max_delay_ms: Maximum time in milliseconds a partial batch waits
         """
         self.event_name = event_name
         self._client = client
         self._app_secret_key = app_secret_key
         self._auto_ack = auto_ack
+        self._batch_size = batch_size
+        self._max_delay_ms = max_delay_ms
     
     def on(self, handler: Callable) -> Callable:
         """
@@ -71,7 +147,10 @@ class GrpcSubscription:
         Returns:
             Function to remove the handler
         """
-        return self._client._on(self.event_name, handler, self._app_secret_key, self._auto_ack)
+        return self._client._on(
+            self.event_name, handler, self._app_secret_key, self._auto_ack,
+            self._batch_size, self._max_delay_ms
+        )
     
     async def ack(self, event_idem: str, block: int) -> str:
         """
@@ -183,9 +262,22 @@ class EnSyncClient:
             "app_secret_key": None,
             "heartbeat_interval": options.get("heartbeatInterval", 30000),
             "reconnect_interval": options.get("reconnectInterval", 5000),
-            "max_reconnect_attempts": options.get("maxReconnectAttempts", 5)
+            "max_reconnect_attempts": options.get("maxReconnectAttempts", 5),
+            "pool_size": max(1, options.get("poolSize", 1)),
+            "session_cache_ttl": options.get("sessionCacheTtl", 0),
+            "channel_options": {**DEFAULT_CHANNEL_OPTIONS, **options.get("channelOptions", {})},
+            "compression": options.get("compression"),
+            "crypto_workers": options.get("cryptoWorkers", os.cpu_count() or 1),
+            "crypto_offload_threshold": options.get("cryptoOffloadThreshold", 64 * 1024)
         }
         
+        if self._config["compression"] is not None and self._config["compression"] not in COMPRESSION_ALGORITHMS:
+            raise EnSyncError(
+                f"Unsupported compression: {self._config['compression']}. "
+                f"Use one of: {', '.join(COMPRESSION_ALGORITHMS)}",
+                "EnSyncValidationError"
+            )
+        
         # State
         self._state = {
             "is_connected": False,
@@ -194,9 +286,17 @@ class EnSyncClient:
             "should_reconnect": True
         }
         
-        # gRPC channel and stub
+        # Session injected through set_session(): (client_id, client_hash, expires_at)
+        self._session = None
+        
+        # gRPC channel and stub (the first entry of the channel pool)
         self._channel = None
         self._stub = None
+        
+        # Channel pool: per-event RPCs and subscription streams are spread round-robin across the stubs
+        self._channels = []
+        self._stubs = []
+        self._stub_cycle = None
         self._heartbeat_task = None
         
         # Subscriptions: event_name -> Set[SubscriptionHandler]
@@ -205,6 +305,9 @@ class EnSyncClient:
         # Subscription tasks: event_name -> asyncio.Task
         self._subscription_tasks = {}
         
+        # Delayed flushes of batching handlers, awaited on close
+        self._flush_tasks = set()
+        
         # Track acknowledged events to prevent duplicate processing (event_idem -> True)
         # Using a simple dict with max size to prevent memory leaks
         self._acknowledged_events = OrderedDict()
@@ -213,9 +316,17 @@ class EnSyncClient:
         # Decorated handlers to be registered on connect
         self._decorated_handlers = []
 
-        # LRU Cache for decoded recipient keys
+        # LRU Cache for decoded recipient keys and their Curve25519 encryption keys
         self._recipient_key_cache_size = options.get("recipientCacheSize", 1000)
         self._recipient_key_cache = OrderedDict()
+        # Payloads may be encrypted on crypto executor threads, which share the cache
+        self._recipient_key_lock = threading.Lock()
+
+        # Curve25519 decryption keys derived from each app secret key
+        self._decryption_key_cache: Dict[str, PrivateKey] = {}
+        
+        # Thread pool for encrypting large payloads, created on first use
+        self._crypto_executor = None
 
         # List to store encryption latencies
         self.encryption_durations = []
@@ -232,12 +343,31 @@ class EnSyncClient:
             Authenticated EnSyncClient instance
             
         Raises:
-            EnSyncError: If authentication fails
+            EnSyncError: If authentication fails, or if an engine shared through
+                get_engine is already using a different appSecretKey
         """
         options = options or {}
+        app_secret_key = options.get("appSecretKey")
+        
+        # Already authenticated with this key (e.g. an engine shared through get_engine)
+        if self._state["is_authenticated"] and self._config["access_key"] == access_key:
+            current_key = self._config["app_secret_key"]
+            if app_secret_key and current_key and app_secret_key != current_key:
+                raise EnSyncError(
+                    "Engine is already using a different appSecretKey; use a separate engine for each key",
+                    "EnSyncValidationError"
+                )
+            if app_secret_key:
+                self._config["app_secret_key"] = app_secret_key
+            # Handlers decorated since the engine connected have no subscription yet
+            await self._subscribe_new_handlers()
+            return self
+        
+        if app_secret_key:
+            self._config["app_secret_key"] = app_secret_key
         self._config["access_key"] = access_key
-        if options.get("appSecretKey"):
-            self._config["app_secret_key"] = options["appSecretKey"]
+        # A previous permanent close() turned off heartbeats and reconnects
+        self._state["should_reconnect"] = True
         await self.connect()
         return self
     
@@ -254,6 +384,16 @@ class EnSyncClient:
         """Gracefully close the gRPC connection and clean up resources."""
         self._state["should_reconnect"] = should_reconnect
 
+        # Snapshot the running tasks so streams cancelled by unsubscribe are awaited too
+        tasks = list(self._subscription_tasks.values())
+
+        # Deliver partial batches while the connection can still acknowledge them; on a
+        # reconnect they are dropped unacknowledged and the server redelivers them
+        await self._settle_pending_events(
+            [handler_obj for handlers in self._subscriptions.values() for handler_obj in handlers],
+            deliver=not should_reconnect and self._state["is_authenticated"]
+        )
+
         # Unsubscribe from all events if authenticated
         if self._stub and self._state["is_authenticated"] and not should_reconnect:
             for event_name in list(self._subscriptions.keys()):
@@ -262,21 +402,36 @@ class EnSyncClient:
                 except Exception as e:
                     logger.error(f"{SERVICE_NAME} Error during unsubscribe on close for {event_name}: {e}")
 
-        # Cancel all running tasks and timers
-        self._clear_timers()
+        # Cancel all running tasks and timers, then wait for them to unwind along with
+        # delayed batch flushes that were already delivering when their timers were stopped
+        tasks.extend(self._clear_timers())
+        tasks.extend(self._flush_tasks)
+        await self._await_cancelled(tasks)
+        
+        if self._crypto_executor and not should_reconnect:
+            self._crypto_executor.shutdown(wait=False)
+            self._crypto_executor = None
 
-        # Close the gRPC channel
+        # Close the gRPC channels
         if self._channel:
             logger.info(f"{SERVICE_NAME} Closing gRPC channel.")
-            await self._channel.close()
+            for channel in self._channels:
+                await self._close_channel(channel)
             self._channel = None
+            self._channels = []
         
         # Reset state
         self._stub = None
+        self._stubs = []
+        self._stub_cycle = None
         self._state["is_connected"] = False
         self._state["is_authenticated"] = False
         
         if not should_reconnect:
+            # A closed engine must not be handed out again by get_engine
+            for key, engine in list(_engine_cache.items()):
+                if engine is self:
+                    del _engine_cache[key]
             logger.info(f"{SERVICE_NAME} Connection permanently closed.")
 
     async def connect(self):
@@ -284,42 +439,9 @@ class EnSyncClient:
         logger.info(f"{SERVICE_NAME} Connecting to {self._config['url']}...")
         
         try:
-            # Create gRPC channel (secure or insecure based on URL)
-            url = self._config["url"]
-            if url.startswith("grpcs://"):
-                # Use secure channel with TLS
-                url = url.replace("grpcs://", "")
-                # Add default port 443 if not specified
-                if ":" not in url:
-                    url = f"{url}:443"
-                credentials = grpc.ssl_channel_credentials()
-                self._channel = grpc.aio.secure_channel(url, credentials)
-                logger.debug(f"{SERVICE_NAME} Using secure gRPC channel (TLS)")
-            elif url.startswith("grpc://"):
-                # Use insecure channel
-                url = url.replace("grpc://", "")
-                # Add default port 50051 if not specified
-                if ":" not in url:
-                    url = f"{url}:50051"
-                self._channel = grpc.aio.insecure_channel(url)
-                logger.debug(f"{SERVICE_NAME} Using insecure gRPC channel")
-            else:
-                # Default: assume secure for production URLs, insecure for localhost
-                if "localhost" in url or "127.0.0.1" in url:
-                    # Add default port 50051 if not specified
-                    if ":" not in url:
-                        url = f"{url}:50051"
-                    self._channel = grpc.aio.insecure_channel(url)
-                    logger.debug(f"{SERVICE_NAME} Using insecure gRPC channel (localhost)")
-                else:
-                    # Add default port 443 if not specified
-                    if ":" not in url:
-                        url = f"{url}:443"
-                    credentials = grpc.ssl_channel_credentials()
-                    self._channel = grpc.aio.secure_channel(url, credentials)
-                    logger.debug(f"{SERVICE_NAME} Using secure gRPC channel (TLS)")
-            
-            self._stub = ensync_pb2_grpc.EnSyncServiceStub(self._channel)
+            target, secure = self._resolve_target()
+            self._create_channels(target, secure)
+            logger.debug(f"{SERVICE_NAME} Using {len(self._channels)} {'secure gRPC channel(s) (TLS)' if secure else 'insecure gRPC channel(s)'}")
             
             logger.info(f"{SERVICE_NAME} gRPC channel established")
             self._state["is_connected"] = True
@@ -337,6 +459,86 @@ class EnSyncClient:
             logger.error(f"{SERVICE_NAME} Connection error - {error}")
             raise grpc_error
     
+    def _resolve_target(self) -> Tuple[str, bool]:
+        """
+        Resolve the configured URL into a host:port target.
+        
+        Returns:
+            Tuple of the target address and whether TLS should be used
+        """
+        url = self._config["url"]
+        if url.startswith("grpcs://"):
+            # Secure channel, default port 443
+            url = url.replace("grpcs://", "")
+            secure = True
+        elif url.startswith("grpc://"):
+            # Insecure channel, default port 50051
+            url = url.replace("grpc://", "")
+            secure = False
+        else:
+            # Default: assume secure for production URLs, insecure for localhost
+            secure = not ("localhost" in url or "127.0.0.1" in url)
+        
+        # Add default port if not specified
+        if ":" not in url:
+            url = f"{url}:443" if secure else f"{url}:50051"
+        return url, secure
+    
+    def _create_channels(self, target: str, secure: bool):
+        """
+        Create the pool of channels and stubs for the target.
+        
+        Authentication and heartbeats use the first channel; every other RPC and
+        subscription stream picks the next channel of the pool through _next_stub().
+        """
+        pool_size = self._config["pool_size"]
+        self._channels = [
+            self._new_channel(target, secure, channel_id if pool_size > 1 else None)
+            for channel_id in range(pool_size)
+        ]
+        self._stubs = [self._new_stub(channel) for channel in self._channels]
+        self._channel = self._channels[0]
+        self._stub = self._stubs[0]
+        self._stub_cycle = itertools.cycle(self._stubs)
+    
+    def _next_stub(self):
+        """Return the stub of the next channel in the pool, round-robin."""
+        return next(self._stub_cycle)
+    
+    def _new_channel(self, target: str, secure: bool, channel_id: Optional[int] = None):
+        """
+        Create a single gRPC channel to the target.
+        
+        Args:
+            target: host:port to connect to
+            secure: Whether to use TLS
+            channel_id: Position of the channel in a pool, None when not pooling
+        """
+        options = dict(self._config["channel_options"])
+        if channel_id is not None:
+            # Pooled channels must not share subchannels, otherwise they all end up on one
+            # connection; the distinct channel_id argument keeps their channel args unique too
+            options["grpc.use_local_subchannel_pool"] = 1
+            options["grpc.channel_id"] = channel_id
+        options = list(options.items())
+        compression = COMPRESSION_ALGORITHMS.get(self._config["compression"])
+        if secure:
+            credentials = grpc.ssl_channel_credentials()
+            return grpc.aio.secure_channel(target, credentials, options=options, compression=compression)
+        return grpc.aio.insecure_channel(target, options=options, compression=compression)
+    
+    def _new_stub(self, channel):
+        """Create the EnSync service stub for a channel."""
+        return ensync_pb2_grpc.EnSyncServiceStub(channel)
+    
+    async def _close_channel(self, channel):
+        """Close a gRPC channel."""
+        await channel.close()
+    
+    def _open_event_stream(self, request):
+        """Open the server stream of events for a subscription request."""
+        return self._next_stub().Subscribe(request)
+    
     async def _authenticate(self):
         """
         Authenticate with the EnSync gRPC server.
@@ -344,6 +546,14 @@ class EnSyncClient:
         Raises:
             EnSyncError: If authentication fails
         """
+        session = self._get_reusable_session()
+        if session:
+            logger.info(f"{SERVICE_NAME} Reusing existing session, skipping authentication request")
+            self._config["client_id"], self._config["client_hash"] = session[0], session[1]
+            self._state["is_authenticated"] = True
+            await self._resubscribe_all()
+            return None
+        
         logger.info(f"{SERVICE_NAME} Sending authentication request...")
         request = ensync_pb2.ConnectRequest(access_key=self._config["access_key"])
         
@@ -355,6 +565,7 @@ class EnSyncClient:
                 self._config["client_id"] = response.client_id
                 self._config["client_hash"] = response.client_hash
                 self._state["is_authenticated"] = True
+                self._store_session(response.client_id, response.client_hash)
                 
                 # Resubscribe to all events (manual and decorated)
                 await self._resubscribe_all()
@@ -365,6 +576,47 @@ class EnSyncClient:
         except grpc.RpcError as e:
             raise EnSyncError(f"gRPC authentication error: {e.details()}", "EnSyncAuthError")
 
+    def set_session(self, client_id: str, client_hash: str, ttl: Optional[int] = None):
+        """
+        Use an already authenticated session instead of authenticating on connect.
+        
+        Lets several clients share the session of one authenticated client, e.g.
+        ``worker.set_session(client.client_id, client.client_hash)``, so only the
+        first one pays for the authentication round-trip.
+        
+        Args:
+            client_id: Client ID of the authenticated session
+            client_hash: Client hash (public key) of the authenticated session
+            ttl: Optional lifetime of the session in milliseconds
+        """
+        expires_at = time.time() + ttl / 1000 if ttl else float("inf")
+        self._session = (client_id, client_hash, expires_at)
+    
+    def _get_reusable_session(self) -> Optional[Tuple[str, str, float]]:
+        """Return an injected or cached session that is not close to expiry."""
+        now = time.time()
+        sessions = [self._session]
+        # Only clients that opted into session sharing read the process-wide cache
+        if self._config["session_cache_ttl"] > 0:
+            sessions.append(_session_cache.get(self._config["access_key"]))
+        for session in sessions:
+            if session and session[2] - now > SESSION_REFRESH_MARGIN:
+                return session
+        return None
+    
+    def _store_session(self, client_id: str, client_hash: str):
+        """Cache a freshly authenticated session when session caching is enabled."""
+        ttl = self._config["session_cache_ttl"]
+        if ttl > 0:
+            _session_cache[self._config["access_key"]] = (client_id, client_hash, time.time() + ttl / 1000)
+    
+    def _invalidate_session(self):
+        """Forget the current session so the next connect authenticates again."""
+        self._session = None
+        cached = _session_cache.get(self._config["access_key"])
+        if cached and cached[0] == self._config["client_id"]:
+            del _session_cache[self._config["access_key"]]
+    
     async def _resubscribe_all(self):
         """Handles the logic of subscribing to all registered handlers upon connection."""
         # Save existing handlers before clearing (preserve the actual SubscriptionHandler objects)
@@ -384,7 +636,12 @@ class EnSyncClient:
         # Add existing handlers back (using the original SubscriptionHandler objects)
         for event_name, handler_objs in existing_handlers.items():
             for handler_obj in handler_objs:
-                opts = {"auto_ack": handler_obj.auto_ack, "app_secret_key": handler_obj.app_secret_key}
+                opts = {
+                    "auto_ack": handler_obj.auto_ack,
+                    "app_secret_key": handler_obj.app_secret_key,
+                    "batch_size": handler_obj.batch_size,
+                    "max_delay_ms": handler_obj.max_delay * 1000
+                }
                 all_handlers_to_process.append((event_name, handler_obj.handler, opts))
 
         # Get unique event names to create one subscription stream per event
@@ -405,7 +662,29 @@ class EnSyncClient:
         for event_name, handler, kwargs in all_handlers_to_process:
             app_secret_key = kwargs.get("app_secret_key")
             auto_ack = kwargs.get("auto_ack", True)
-            self._on(event_name, handler, app_secret_key, auto_ack)
+            self._on(
+                event_name, handler, app_secret_key, auto_ack,
+                kwargs.get("batch_size", 1), kwargs.get("max_delay_ms", 100)
+            )
+    
+    async def _subscribe_new_handlers(self):
+        """Subscribe decorated handlers that are not registered on the current connection."""
+        for event_name, handler, kwargs in self._decorated_handlers:
+            if any(handler_obj.handler == handler for handler_obj in self._subscriptions.get(event_name, ())):
+                continue
+            
+            if event_name not in self._subscription_tasks:
+                try:
+                    logger.info(f"{SERVICE_NAME} Establishing subscription for {event_name}")
+                    await self._create_subscription(event_name, kwargs)
+                except Exception as error:
+                    logger.error(f"{SERVICE_NAME} Failed to create subscription for {event_name}: {error}")
+                    continue
+            
+            self._on(
+                event_name, handler, kwargs.get("app_secret_key"), kwargs.get("auto_ack", True),
+                kwargs.get("batch_size", 1), kwargs.get("max_delay_ms", 100)
+            )
     
     async def _handle_close(self, reason: str):
         """Handle gRPC connection close events and trigger reconnection if configured."""
@@ -414,6 +693,9 @@ class EnSyncClient:
 
         logger.warning(f"{SERVICE_NAME} Connection lost, reason: {reason or 'none provided'}")
         
+        # The server may have dropped the session along with the connection
+        self._invalidate_session()
+        
         # Close the connection and signal that we want to reconnect
         await self.close(should_reconnect=True)
 
@@ -437,49 +719,54 @@ class EnSyncClient:
     
     def _decrypt_payload(self, encrypted_payload: str, app_secret_key: Optional[str] = None) -> Dict[str, Any]:
         """Decrypt an encrypted payload."""
+        decrypted_str = self._decrypt_payload_json(encrypted_payload, app_secret_key)
+        if decrypted_str is None:
+            return {"success": False}
+        
+        try:
+            return {"success": True, "payload": _loads(decrypted_str)}
+        except Exception as e:
+            logger.error(f"{SERVICE_NAME} Failed to decrypt with key: {str(e)}")
+            return {"success": False}
+    
+    def _decrypt_payload_json(self, encrypted_payload: str, app_secret_key: Optional[str] = None) -> Optional[str]:
+        """Decrypt an encrypted payload into its JSON text, or return None if it cannot be decrypted."""
         try:
             decryption_key = app_secret_key or self._config.get("app_secret_key") or self._config.get("client_hash")
             
             if not decryption_key:
                 logger.error(f"{SERVICE_NAME} No decryption key available")
-                return {"success": False}
+                return None
+            
+            private_key = self._get_decryption_key(decryption_key)
             
             # Decode the base64 payload
             decoded_payload = base64.b64decode(encrypted_payload)
-            encrypted_data = json.loads(decoded_payload.decode('utf-8'))
+            encrypted_data = _loads(decoded_payload)
             
             # Check if this is a hybrid encrypted message
             if encrypted_data and encrypted_data.get("type") == "hybrid":
                 encrypted_payload_data = encrypted_data["payload"]
                 keys = encrypted_data["keys"]
                 
-                decrypted = False
                 recipient_ids = list(keys.keys())
                 
                 for recipient_id in recipient_ids:
                     try:
                         encrypted_key = keys[recipient_id]
-                        message_key = decrypt_message_key(encrypted_key, decryption_key)
-                        decrypted_str = decrypt_with_message_key(encrypted_payload_data, message_key)
-                        payload = json.loads(decrypted_str)
-                        decrypted = True
-                        break
+                        message_key = decrypt_message_key(encrypted_key, private_key)
+                        return decrypt_with_message_key(encrypted_payload_data, message_key)
                     except Exception as error:
                         logger.debug(f"{SERVICE_NAME} Couldn't decrypt with recipient ID {recipient_id}: {str(error)}")
                 
-                if not decrypted:
-                    logger.error(f"{SERVICE_NAME} Failed to decrypt hybrid message with any of the {len(recipient_ids)} recipient keys")
-                    return {"success": False}
-                
-                return {"success": True, "payload": payload}
+                logger.error(f"{SERVICE_NAME} Failed to decrypt hybrid message with any of the {len(recipient_ids)} recipient keys")
+                return None
             else:
                 # Handle traditional encryption
-                decrypted_str = decrypt_ed25519(encrypted_data, decryption_key)
-                payload = json.loads(decrypted_str)
-                return {"success": True, "payload": payload}
+                return decrypt_ed25519(encrypted_data, private_key)
         except Exception as e:
             logger.error(f"{SERVICE_NAME} Failed to decrypt with key: {str(e)}")
-            return {"success": False}
+            return None
     
     async def _start_heartbeat_interval(self):
         """Start the heartbeat interval."""
@@ -493,30 +780,181 @@ class EnSyncClient:
                 logger.error(f"{SERVICE_NAME} Error in heartbeat interval: {str(e)}")
                 break
     
-    def _clear_timers(self):
-        """Clear all timers and tasks."""
+    def _clear_timers(self) -> List[asyncio.Task]:
+        """
+        Cancel all timers and tasks.
+
+        Returns:
+            The tasks that were cancelled, so the caller can wait for them
+        """
+        cancelled = []
         if self._heartbeat_task:
             self._heartbeat_task.cancel()
+            cancelled.append(self._heartbeat_task)
             self._heartbeat_task = None
         
         # Cancel all subscription tasks
         for task in self._subscription_tasks.values():
             task.cancel()
+            cancelled.append(task)
         self._subscription_tasks.clear()
+        return cancelled
+    
+    @staticmethod
+    async def _await_cancelled(tasks: List[asyncio.Task]):
+        """
+        Wait for cancelled or finishing tasks so none are left running after close.
+
+        The calling task is skipped, since close() may run inside a heartbeat
+        or stream task when the connection drops.
+        """
+        current = asyncio.current_task()
+        pending = [task for task in tasks if task is not current]
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+    
+    def _get_decryption_key(self, app_secret_key: str) -> PrivateKey:
+        """Get the Curve25519 decryption key for an app secret key, deriving it once per key."""
+        private_key = self._decryption_key_cache.get(app_secret_key)
+        if private_key is None:
+            private_key = to_curve25519_private_key(app_secret_key)
+            self._decryption_key_cache[app_secret_key] = private_key
+        return private_key
     
-    def _get_recipient_key(self, recipient: str) -> bytes:
-        """Get a decoded recipient key from the cache, managing LRU policy."""
-        if recipient in self._recipient_key_cache:
-            self._recipient_key_cache.move_to_end(recipient)
-            return self._recipient_key_cache[recipient]
+    def _get_recipient_key(self, recipient: str) -> Tuple[bytes, PublicKey]:
+        """
+        Get a recipient's decoded key and its Curve25519 encryption key from the cache,
+        managing LRU policy.
+        """
+        with self._recipient_key_lock:
+            if recipient in self._recipient_key_cache:
+                self._recipient_key_cache.move_to_end(recipient)
+                return self._recipient_key_cache[recipient]
 
-        if len(self._recipient_key_cache) >= self._recipient_key_cache_size:
-            self._recipient_key_cache.popitem(last=False)
+            if len(self._recipient_key_cache) >= self._recipient_key_cache_size:
+                self._recipient_key_cache.popitem(last=False)
 
-        decoded_key = base64.b64decode(recipient)
-        self._recipient_key_cache[recipient] = decoded_key
-        return decoded_key
+            decoded_key = base64.b64decode(recipient)
+            keys = (decoded_key, to_curve25519_public_key(decoded_key))
+            self._recipient_key_cache[recipient] = keys
+            return keys
+
+    
+    def _validate_publish_args(self, recipients: List[str]):
+        """Check authentication and recipients before publishing."""
+        if not self._state["is_authenticated"]:
+            raise EnSyncError("Not authenticated", "EnSyncAuthError")
+        
+        if not isinstance(recipients, list):
+            raise EnSyncError("recipients must be an array", "EnSyncAuthError")
+        
+        if len(recipients) == 0:
+            raise EnSyncError("recipients array cannot be empty", "EnSyncAuthError")
+    
+    async def _prepare_publish_requests(self, event_name: str, recipients: List[str], payload: Any,
+                                        metadata_json: str, use_hybrid_encryption: bool,
+                                        recipient_keys: List[Tuple[bytes, PublicKey]] = None) -> List[Any]:
+        """
+        Build the publish requests for a payload, encrypting large payloads on the crypto
+        thread pool so the event loop keeps driving other RPCs meanwhile.
+        """
+        payload_bytes = _dumps(payload)
+        build = functools.partial(
+            self._build_publish_requests, event_name, recipients, payload, metadata_json,
+            use_hybrid_encryption, payload_bytes, recipient_keys
+        )
+        
+        if self._config["crypto_workers"] > 0 and len(payload_bytes) >= self._config["crypto_offload_threshold"]:
+            if self._crypto_executor is None:
+                self._crypto_executor = ThreadPoolExecutor(
+                    max_workers=self._config["crypto_workers"], thread_name_prefix="ensync-crypto"
+                )
+            return await asyncio.get_event_loop().run_in_executor(self._crypto_executor, build)
+        
+        return build()
+    
+    def _build_publish_requests(self, event_name: str, recipients: List[str], payload: Any,
+                                metadata_json: str, use_hybrid_encryption: bool,
+                                payload_bytes: bytes = None,
+                                recipient_keys: List[Tuple[bytes, PublicKey]] = None) -> List[Any]:
+        """Encrypt a payload and build one PublishEventRequest per recipient."""
+        if recipient_keys is None:
+            recipient_keys = [self._get_recipient_key(r) for r in recipients]
+        
+        # Serialize payload to bytes and create metadata
+        if payload_bytes is None:
+            payload_bytes = _dumps(payload)
+        # byte_size is measured as the WebSocket client measures it, whichever encoder
+        # produced payload_bytes
+        payload_metadata = get_payload_metadata(payload) if isinstance(payload, dict) else {
+            "byte_size": len(json.dumps(payload).encode('utf-8')),
+            "skeleton": {}
+        }
+        
+        # Serialize payload_metadata as JSON string for gRPC
+        payload_metadata_json = _dumps(payload_metadata).decode('utf-8')
+        
+        # Fields shared by every recipient's request are set once and copied per recipient
+        template = ensync_pb2.PublishEventRequest(
+            client_id=self._config["client_id"],
+            event_name=event_name,
+            metadata=metadata_json,
+            payload_metadata=payload_metadata_json
+        )
+        requests = []
+        
+        # Only use hybrid encryption when there are multiple recipients
+        if use_hybrid_encryption and len(recipients) > 1:
+            # Use hybrid encryption (one encryption for all recipients)
+            recipient_keys_bytes = [decoded_key for decoded_key, _ in recipient_keys]
+            curve25519_keys = [curve25519_key for _, curve25519_key in recipient_keys]
+            
+            start_time = time.time()
+            encrypted_data = hybrid_encrypt(payload_bytes, recipient_keys_bytes, curve25519_keys)
+            end_time = time.time()
+            self.encryption_durations.append((end_time - start_time) * 1000)  # in ms
+            
+            # Format for transmission
+            hybrid_message = {
+                "type": "hybrid",
+                "payload": encrypted_data["encryptedPayload"],
+                "keys": encrypted_data["encryptedKeys"]
+            }
+            
+            # Serialize and base64 encode
+            template.payload = base64.b64encode(_dumps(hybrid_message)).decode('utf-8')
+            
+            # Send to all recipients with the same encrypted payload
+            for recipient in recipients:
+                request = ensync_pb2.PublishEventRequest()
+                request.CopyFrom(template)
+                request.delivery_to = recipient
+                requests.append(request)
+        else:
+            # Use traditional encryption (separate encryption for each recipient)
+            for recipient, (_, recipient_key) in zip(recipients, recipient_keys):
+                
+                start_time = time.time()
+                encrypted = encrypt_ed25519(payload_bytes, recipient_key)
+                end_time = time.time()
+                self.encryption_durations.append((end_time - start_time) * 1000)  # in ms
 
+                request = ensync_pb2.PublishEventRequest()
+                request.CopyFrom(template)
+                request.payload = base64.b64encode(_dumps(encrypted)).decode('utf-8')
+                request.delivery_to = recipient
+                requests.append(request)
+        
+        return requests
+    
+    async def _send_publish_request(self, request) -> str:
+        """Send a single PublishEventRequest and return the event identifier."""
+        response = await self._next_stub().PublishEvent(request)
+        
+        if not response.success:
+            raise EnSyncError(response.error_message, "EnSyncPublishError")
+        
+        return response.event_idem
     
     async def publish(self, event_name: str, recipients: List[str] = None, payload: Dict[str, Any] = None,
                     metadata: Dict[str, Any] = None, options: Dict[str, Any] = None) -> str:
@@ -536,103 +974,130 @@ class EnSyncClient:
         Raises:
             EnSyncError: If publishing fails
         """
-        if not self._state["is_authenticated"]:
-            raise EnSyncError("Not authenticated", "EnSyncAuthError")
-        
-        if not isinstance(recipients, list):
-            raise EnSyncError("recipients must be an array", "EnSyncAuthError")
-        
-        if len(recipients) == 0:
-            raise EnSyncError("recipients array cannot be empty", "EnSyncAuthError")
+        self._validate_publish_args(recipients)
         
         if payload is None:
             raise EnSyncError("payload cannot be None", "EnSyncPublishError")
         
         use_hybrid_encryption = options.get("useHybridEncryption", True) if options else True
-        metadata = metadata or {}
+        metadata_json = _dumps(metadata or {}).decode('utf-8')
         
-        # Serialize payload to bytes and create metadata
-        payload_bytes = json.dumps(payload).encode('utf-8')
-        payload_metadata = get_payload_metadata(payload) if isinstance(payload, dict) else {
-            "byte_size": len(payload_bytes),
-            "skeleton": {}
-        }
+        try:
+            requests = await self._prepare_publish_requests(
+                event_name, recipients, payload, metadata_json, use_hybrid_encryption
+            )
+            
+            responses = []
+            for request in requests:
+                responses.append(await self._send_publish_request(request))
+            
+            return ",".join(responses)
+        except grpc.RpcError as e:
+            raise EnSyncError(f"gRPC publish error: {e.details()}", "EnSyncPublishError")
+        except Exception as error:
+            raise EnSyncError(str(error), "EnSyncPublishError")
+    
+    async def publish_batch(self, event_name: str, recipients: List[str] = None,
+                            payloads: List[Dict[str, Any]] = None, metadata: Dict[str, Any] = None,
+                            options: Dict[str, Any] = None) -> List[str]:
+        """
+        Publish several payloads under the same event name to the same recipients.
         
-        # Serialize payload_metadata as JSON string for gRPC
-        payload_metadata_json = json.dumps(payload_metadata)
+        Every payload is encrypted up front (large payloads in parallel on the crypto
+        thread pool) and the resulting requests are sent concurrently over the channel,
+        so a batch waits for roughly one round-trip instead of one per event.
+        
+        Args:
+            event_name: Name of the event
+            recipients: List of recipient public keys
+            payloads: List of event payloads
+            metadata: Event metadata shared by every payload
+            options: Publishing options
+            
+        Returns:
+            Event identifiers, one entry per payload in the same format as publish()
+            
+        Raises:
+            EnSyncError: If publishing fails
+        """
+        self._validate_publish_args(recipients)
+        
+        if not isinstance(payloads, list) or len(payloads) == 0:
+            raise EnSyncError("payloads must be a non-empty array", "EnSyncPublishError")
+        
+        if any(payload is None for payload in payloads):
+            raise EnSyncError("payload cannot be None", "EnSyncPublishError")
+        
+        use_hybrid_encryption = options.get("useHybridEncryption", True) if options else True
+        metadata_json = _dumps(metadata or {}).decode('utf-8')
         
         try:
-            responses = []
+            # Large payloads are encrypted in parallel on the crypto thread pool
+            batches = await asyncio.gather(*(
+                self._prepare_publish_requests(event_name, recipients, payload, metadata_json, use_hybrid_encryption)
+                for payload in payloads
+            ))
             
-            # Only use hybrid encryption when there are multiple recipients
-            if use_hybrid_encryption and len(recipients) > 1:
-                # Use hybrid encryption (one encryption for all recipients)
-                recipient_keys_bytes = [self._get_recipient_key(r) for r in recipients]
-                
-                start_time = time.time()
-                encrypted_data = hybrid_encrypt(payload_bytes, recipient_keys_bytes)
-                end_time = time.time()
-                self.encryption_durations.append((end_time - start_time) * 1000)  # in ms
-                
-                # Format for transmission
-                hybrid_message = {
-                    "type": "hybrid",
-                    "payload": encrypted_data["encryptedPayload"],
-                    "keys": encrypted_data["encryptedKeys"]
-                }
-                
-                # Serialize and base64 encode
-                encrypted_base64 = base64.b64encode(json.dumps(hybrid_message).encode('utf-8')).decode('utf-8')
-                
-                # Send to all recipients with the same encrypted payload
-                for recipient in recipients:
-                    request = ensync_pb2.PublishEventRequest(
-                        client_id=self._config["client_id"],
-                        event_name=event_name,
-                        payload=encrypted_base64,
-                        delivery_to=recipient,
-                        metadata=json.dumps(metadata),
-                        payload_metadata=payload_metadata_json
-                    )
-                    response = await self._stub.PublishEvent(request)
-                    
-                    if not response.success:
-                        raise EnSyncError(response.error_message, "EnSyncPublishError")
-                    
-                    responses.append(response.event_idem)
-            else:
-                # Use traditional encryption (separate encryption for each recipient)
-                for recipient in recipients:
-                    recipient_bytes = self._get_recipient_key(recipient)
-                    
-                    start_time = time.time()
-                    encrypted = encrypt_ed25519(payload_bytes, recipient_bytes)
-                    end_time = time.time()
-                    self.encryption_durations.append((end_time - start_time) * 1000)  # in ms
-
-                    encrypted_base64 = base64.b64encode(json.dumps(encrypted).encode('utf-8')).decode('utf-8')
-                    
-                    request = ensync_pb2.PublishEventRequest(
-                        client_id=self._config["client_id"],
-                        event_name=event_name,
-                        payload=encrypted_base64,
-                        delivery_to=recipient,
-                        metadata=json.dumps(metadata),
-                        payload_metadata=payload_metadata_json
-                    )
-                    response = await self._stub.PublishEvent(request)
-                    
-                    if not response.success:
-                        raise EnSyncError(response.error_message, "EnSyncPublishError")
-                    
-                    responses.append(response.event_idem)
+            event_idems = iter(await asyncio.gather(
+                *(self._send_publish_request(request) for requests in batches for request in requests)
+            ))
             
-            return ",".join(responses)
+            return [",".join(next(event_idems) for _ in requests) for requests in batches]
         except grpc.RpcError as e:
             raise EnSyncError(f"gRPC publish error: {e.details()}", "EnSyncPublishError")
         except Exception as error:
             raise EnSyncError(str(error), "EnSyncPublishError")
     
+    def prepare_publish(self, event_name: str, recipients: List[str] = None, metadata: Dict[str, Any] = None,
+                        options: Dict[str, Any] = None) -> Callable[[Dict[str, Any]], Awaitable[str]]:
+        """
+        Prepare a fast path for publishing repeatedly to a fixed event name and recipients.
+        
+        Validation, metadata serialization and recipient key decoding happen once here;
+        the returned coroutine function only encrypts and sends each payload.
+        
+        Args:
+            event_name: Name of the events
+            recipients: List of recipient public keys
+            metadata: Event metadata shared by every event
+            options: Publishing options
+            
+        Returns:
+            Async function taking a payload and returning its event identifier,
+            in the same format as publish()
+            
+        Raises:
+            EnSyncError: If the client is not authenticated or recipients are invalid
+        """
+        self._validate_publish_args(recipients)
+        
+        use_hybrid_encryption = options.get("useHybridEncryption", True) if options else True
+        metadata_json = _dumps(metadata or {}).decode('utf-8')
+        recipient_keys = [self._get_recipient_key(r) for r in recipients]
+        prepare = self._prepare_publish_requests
+        send = self._send_publish_request
+        
+        async def publish_prepared(payload: Dict[str, Any]) -> str:
+            if not self._state["is_authenticated"]:
+                raise EnSyncError("Not authenticated", "EnSyncAuthError")
+            
+            if payload is None:
+                raise EnSyncError("payload cannot be None", "EnSyncPublishError")
+            
+            try:
+                requests = await prepare(
+                    event_name, recipients, payload, metadata_json, use_hybrid_encryption, recipient_keys
+                )
+                if len(requests) == 1:
+                    return await send(requests[0])
+                return ",".join(await asyncio.gather(*(send(request) for request in requests)))
+            except grpc.RpcError as e:
+                raise EnSyncError(f"gRPC publish error: {e.details()}", "EnSyncPublishError")
+            except Exception as error:
+                raise EnSyncError(str(error), "EnSyncPublishError")
+        
+        return publish_prepared
+    
     def subscribe(self, event_name: str, **kwargs):
         """
         Decorator to register an event handler for a subscription.
@@ -643,11 +1108,18 @@ class EnSyncClient:
         Args:
             event_name (str): The name of the event to subscribe to.
             **kwargs: Subscription options like `auto_ack` and `app_secret_key`.
+                With `batch_size` > 1 the handler receives a list of up to that many
+                events, delivered once the batch is full or `max_delay_ms` (default 100)
+                after its first event arrived.
 
         Example:
             @engine.subscribe("my.event", auto_ack=True)
             async def handle_my_event(event):
                 print(f"Received: {event['payload']}")
+
+            @engine.subscribe("my.event", batch_size=100, max_delay_ms=50)
+            async def handle_my_events(events):
+                print(f"Received {len(events)} events")
         """
         def decorator(handler: Callable):
             self._decorated_handlers.append((event_name, handler, kwargs))
@@ -698,7 +1170,9 @@ class EnSyncClient:
                 event_name, 
                 self, 
                 options.get("appSecretKey"),
-                options.get("autoAck", True)
+                options.get("autoAck", True),
+                options.get("batch_size", 1),
+                options.get("max_delay_ms", 100)
             )
         except grpc.RpcError as e:
             raise EnSyncError(f"gRPC subscription error: {e.details()}", "EnSyncSubscriptionError")
@@ -708,7 +1182,7 @@ class EnSyncClient:
     async def _handle_event_stream(self, event_name: str, request, options: Dict[str, Any]):
         """Handle incoming event stream for a subscription."""
         try:
-            async for event_response in self._stub.Subscribe(request):
+            async for event_response in self._open_event_stream(request):
                 if event_name in self._subscriptions:
                     handlers = self._subscriptions[event_name]
                     
@@ -720,28 +1194,40 @@ class EnSyncClient:
                         "timestamp": None,
                         "payload": None,
                         "sender": event_response.sender,
-                        "metadata": json.loads(event_response.metadata) if event_response.metadata else {}
+                        "metadata": _loads(event_response.metadata) if event_response.metadata else {}
                     }
                     
+                    # Handlers sharing a decryption key share one decryption of the payload
+                    decrypted_payloads = {}
+                    
                     # Process handlers sequentially
                     for handler_obj in handlers:
                         try:
+                            # Check if we've already processed this event (deduplication)
+                            event_idem = event_data.get("idem")
+                            if event_idem and event_idem in self._acknowledged_events:
+                                logger.debug(f"{SERVICE_NAME} Skipping duplicate event: {event_idem}")
+                                continue
+                            
                             # Decrypt the payload
-                            decryption_result = self._decrypt_payload(
-                                event_response.payload,
-                                handler_obj.app_secret_key
-                            )
+                            if handler_obj.app_secret_key not in decrypted_payloads:
+                                decrypted_payloads[handler_obj.app_secret_key] = self._decrypt_payload_json(
+                                    event_response.payload,
+                                    handler_obj.app_secret_key
+                                )
+                            decrypted_json = decrypted_payloads[handler_obj.app_secret_key]
                             
-                            if not decryption_result.get("success"):
+                            if decrypted_json is None:
                                 logger.error(f"{SERVICE_NAME} Failed to decrypt event payload")
                                 continue
                             
-                            event_data["payload"] = decryption_result["payload"]
+                            # Only the decrypted text is shared; each handler gets its own payload
+                            # object, so changes one handler makes to it do not reach the others
+                            event_data["payload"] = _loads(decrypted_json)
                             
-                            # Check if we've already processed this event (deduplication)
-                            event_idem = event_data.get("idem")
-                            if event_idem and event_idem in self._acknowledged_events:
-                                logger.debug(f"{SERVICE_NAME} Skipping duplicate event: {event_idem}")
+                            # Batching handlers keep a reference to the event, so give them their own copy
+                            if handler_obj.batch_size > 1:
+                                await self._buffer_event(handler_obj, dict(event_data))
                                 continue
                             
                             # Call handler
@@ -750,34 +1236,8 @@ class EnSyncClient:
                                 await result
                             
                             # Auto-acknowledge if enabled
-                            if handler_obj.auto_ack and event_data.get("idem") and event_data.get("block"):
-                                try:
-                                    await self._ack(event_data["idem"], event_data["block"], event_data["eventName"])
-                                    
-                                    # Track this event as acknowledged (LRU cache)
-                                    if event_idem:
-                                        self._acknowledged_events[event_idem] = True
-                                        # Maintain cache size limit
-                                        if len(self._acknowledged_events) > self._max_ack_cache_size:
-                                            self._acknowledged_events.popitem(last=False)
-                                            
-                                except EnSyncError as err:
-                                    # Check if it's a duplicate acknowledgment (already processed)
-                                    error_msg = str(err).lower()
-                                    if "already" in error_msg or "duplicate" in error_msg or "acknowledged" in error_msg:
-                                        # Duplicate acks are expected after reconnection
-                                        logger.debug(f"{SERVICE_NAME} Event already acknowledged: {event_data['idem']}")
-                                        # Still track it to prevent reprocessing
-                                        if event_idem:
-                                            self._acknowledged_events[event_idem] = True
-                                            if len(self._acknowledged_events) > self._max_ack_cache_size:
-                                                self._acknowledged_events.popitem(last=False)
-                                    else:
-                                        # Real error - log and potentially retry
-                                        logger.error(f"{SERVICE_NAME} Failed to acknowledge event {event_data['idem']}: {err}")
-                                        # Event will be redelivered by server since ack failed
-                                except Exception as err:
-                                    logger.error(f"{SERVICE_NAME} Unexpected error during auto-ack: {err}")
+                            if handler_obj.auto_ack:
+                                await self._auto_ack(event_data)
                         except Exception as e:
                             logger.error(f"{SERVICE_NAME} Event handler error - {e}")
         except grpc.RpcError as e:
@@ -835,7 +1295,100 @@ class EnSyncClient:
             except Exception as retry_error:
                 logger.error(f"{SERVICE_NAME} Failed to reestablish subscription for '{event_name}': {retry_error}")
     
-    def _on(self, event_name: str, handler: Callable, app_secret_key: Optional[str], auto_ack: bool = True):
+    async def _auto_ack(self, event_data: Dict[str, Any]):
+        """Acknowledge a handled event and remember it to skip redeliveries."""
+        event_idem = event_data.get("idem")
+        if not event_idem or not event_data.get("block"):
+            return
+        
+        try:
+            await self._ack(event_idem, event_data["block"], event_data["eventName"])
+            
+            # Track this event as acknowledged (LRU cache)
+            self._acknowledged_events[event_idem] = True
+            # Maintain cache size limit
+            if len(self._acknowledged_events) > self._max_ack_cache_size:
+                self._acknowledged_events.popitem(last=False)
+                
+        except EnSyncError as err:
+            # Check if it's a duplicate acknowledgment (already processed)
+            error_msg = str(err).lower()
+            if "already" in error_msg or "duplicate" in error_msg or "acknowledged" in error_msg:
+                # Duplicate acks are expected after reconnection
+                logger.debug(f"{SERVICE_NAME} Event already acknowledged: {event_idem}")
+                # Still track it to prevent reprocessing
+                self._acknowledged_events[event_idem] = True
+                if len(self._acknowledged_events) > self._max_ack_cache_size:
+                    self._acknowledged_events.popitem(last=False)
+            else:
+                # Real error - log and potentially retry
+                logger.error(f"{SERVICE_NAME} Failed to acknowledge event {event_idem}: {err}")
+                # Event will be redelivered by server since ack failed
+        except Exception as err:
+            logger.error(f"{SERVICE_NAME} Unexpected error during auto-ack: {err}")
+    
+    async def _buffer_event(self, handler_obj: SubscriptionHandler, event_data: Dict[str, Any]):
+        """Add an event to a batching handler, delivering the batch once it is full."""
+        handler_obj.pending_events.append(event_data)
+        
+        if len(handler_obj.pending_events) >= handler_obj.batch_size:
+            await self._flush_events(handler_obj)
+        elif handler_obj.flush_task is None:
+            handler_obj.flush_task = asyncio.create_task(self._flush_events_later(handler_obj))
+            self._flush_tasks.add(handler_obj.flush_task)
+            handler_obj.flush_task.add_done_callback(self._flush_tasks.discard)
+    
+    async def _flush_events_later(self, handler_obj: SubscriptionHandler):
+        """Deliver a partial batch once its first event has waited max_delay_ms."""
+        await asyncio.sleep(handler_obj.max_delay)
+        handler_obj.flush_task = None
+        await self._flush_events(handler_obj)
+    
+    async def _flush_events(self, handler_obj: SubscriptionHandler):
+        """Deliver the pending events of a batching handler and auto-acknowledge them."""
+        if handler_obj.flush_task is not None:
+            handler_obj.flush_task.cancel()
+            handler_obj.flush_task = None
+        
+        events, handler_obj.pending_events = handler_obj.pending_events, []
+        if not events:
+            return
+        
+        try:
+            result = handler_obj.handler(events)
+            if asyncio.iscoroutine(result):
+                await result
+        except Exception as e:
+            logger.error(f"{SERVICE_NAME} Event handler error - {e}")
+            return
+        
+        # The server acknowledges events individually, so ack the whole batch concurrently
+        if handler_obj.auto_ack:
+            await asyncio.gather(*(self._auto_ack(event_data) for event_data in events))
+    
+    async def _settle_pending_events(self, handler_objs: List[SubscriptionHandler], deliver: bool):
+        """
+        Stop the flush timers of batching handlers and settle their partial batches.
+        
+        Args:
+            handler_objs: Handlers whose partial batches are settled
+            deliver: Deliver and acknowledge the pending events; when False they are
+                dropped unacknowledged
+        """
+        for handler_obj in handler_objs:
+            if handler_obj.flush_task is not None:
+                handler_obj.flush_task.cancel()
+                handler_obj.flush_task = None
+            if not deliver:
+                handler_obj.pending_events = []
+        
+        if deliver:
+            await asyncio.gather(*(
+                self._flush_events(handler_obj) for handler_obj in handler_objs if handler_obj.pending_events
+            ))
+    
+    def _on(self, event_name: str, handler: Callable, app_secret_key: Optional[str], auto_ack: bool = True,
+            batch_size: int = 1, max_delay_ms: float = 100):
         """Add an event handler for a subscribed event."""
         if event_name not in self._subscriptions:
             self._subscriptions[event_name] = set()
@@ -847,7 +1400,7 @@ class EnSyncClient:
                 logger.debug(f"{SERVICE_NAME} Handler already registered for {event_name}, skipping duplicate")
                 return lambda: None  # Return no-op function
         
-        wrapped_handler = SubscriptionHandler(handler, app_secret_key, auto_ack)
+        wrapped_handler = SubscriptionHandler(handler, app_secret_key, auto_ack, batch_size, max_delay_ms)
         self._subscriptions[event_name].add(wrapped_handler)
         
         def remove_handler():
@@ -870,12 +1423,15 @@ class EnSyncClient:
         if not self._state["is_authenticated"]:
             raise EnSyncError("Not authenticated", "EnSyncAuthError")
         
+        # Hand any partial batches to their handlers before the stream goes away
+        await self._settle_pending_events(list(self._subscriptions.get(event_name, ())), deliver=True)
+        
         try:
             request = ensync_pb2.UnsubscribeRequest(
                 client_id=self._config["client_id"],
                 event_name=event_name
             )
-            response = await self._stub.Unsubscribe(request)
+            response = await self._next_stub().Unsubscribe(request)
             
             if response.success:
                 # Cancel the stream task
@@ -905,7 +1461,7 @@ class EnSyncClient:
                 partition_block=block,
                 event_name=event_name
             )
-            response = await self._stub.AcknowledgeEvent(request)
+            response = await self._next_stub().AcknowledgeEvent(request)
             
             if not response.success:
                 raise EnSyncError(response.message, "EnSyncGenericError")
@@ -929,7 +1485,7 @@ class EnSyncClient:
                 event_name=event_name,
                 reason=reason
             )
-            response = await self._stub.DiscardEvent(request)
+            response = await self._next_stub().DiscardEvent(request)
             
             if not response.success:
                 raise EnSyncError(response.message, "EnSyncEventError")
@@ -963,7 +1519,7 @@ class EnSyncClient:
                 delay_ms=delay_ms,
                 reason=reason
             )
-            response = await self._stub.DeferEvent(request)
+            response = await self._next_stub().DeferEvent(request)
             
             if not response.success:
                 raise EnSyncError(response.message, "EnSyncEventError")
@@ -994,7 +1550,7 @@ class EnSyncClient:
                 client_id=self._config["client_id"],
                 event_name=event_name
             )
-            response = await self._stub.ContinueEvents(request)
+            response = await self._next_stub().ContinueEvents(request)
             
             if not response.success:
                 raise EnSyncError(response.message, "EnSyncContinueError")
@@ -1022,7 +1578,7 @@ class EnSyncClient:
                 event_name=event_name,
                 reason=reason
             )
-            response = await self._stub.PauseEvents(request)
+            response = await self._next_stub().PauseEvents(request)
             
             if not response.success:
                 raise EnSyncError(response.message, "EnSyncPauseError")
@@ -1054,7 +1610,7 @@ class EnSyncClient:
                 event_idem=event_idem,
                 event_name=event_name
             )
-            response = await self._stub.ReplayEvent(request)
+            response = await self._next_stub().ReplayEvent(request)
             
             if not response.success:
                 raise EnSyncError(response.message, "EnSyncReplayError")
@@ -1101,3 +1657,27 @@ class EnSyncClient:
         """Get the client's public key (client hash). Deprecated: use client_hash property."""
         return self.client_hash
     
+
+
+def get_engine(url: str, options: Dict[str, Any] = None, engine_class: type = None) -> EnSyncClient:
+    """
+    Get a shared engine for the URL and options, creating it on first use.
+    
+    Reusing one engine keeps its channels, and the authenticated session once
+    create_client() has run, for the lifetime of the process instead of
+    reconnecting for every caller.
+    
+    Args:
+        url: gRPC server URL for EnSync service
+        options: Configuration options, as for EnSyncClient
+        engine_class: Engine class to create (default: EnSyncClient)
+        
+    Returns:
+        The engine shared by all callers with the same class, URL and options
+    """
+    engine_class = engine_class or EnSyncClient
+    key = (engine_class, url, json.dumps(options or {}, sort_keys=True, default=str))
+    engine = _engine_cache.get(key)
+    if engine is None:
+        engine = _engine_cache[key] = engine_class(url, options)
+    return engine
@@ -0,0 +1,122 @@
+"""
+EnSync gRPC client for Python built on grpclib.
+Provides the same API as the grpcio based client using a pure-asyncio HTTP/2 transport.
+"""
+from typing import Any, AsyncIterator, Dict, Optional
+
+import grpc
+
+from .grpc_client import EnSyncClient, logger, SERVICE_NAME
+
+try:
+    from grpclib.client import Channel
+    from grpclib.exceptions import GRPCError, StreamTerminatedError
+except ImportError as e:
+    raise ImportError("grpclib is required for the grpclib transport. Please run: pip install ensync_sdk[grpclib]") from e
+
+# Import generated grpclib stubs
+try:
+    from . import ensync_grpc
+except ImportError as e:
+    raise ImportError("Failed to import grpclib stubs. Please run: python -m grpc_tools.protoc -I. --grpclib_python_out=./ensync ensync.proto") from e
+
+# Failures grpclib raises instead of grpc.RpcError: call statuses, dropped streams and
+# connections that cannot be (re)established
+TRANSPORT_ERRORS = (GRPCError, StreamTerminatedError, OSError)
+
+
+class GrpclibRpcError(grpc.RpcError):
+    """A grpclib failure presented as a grpcio RpcError, so the client's error handling applies."""
+    
+    def __init__(self, code: grpc.StatusCode, details: str):
+        super().__init__(details)
+        self._code = code
+        self._details = details
+    
+    def code(self) -> grpc.StatusCode:
+        return self._code
+    
+    def details(self) -> str:
+        return self._details
+
+
+def to_rpc_error(error: Exception) -> GrpclibRpcError:
+    """
+    Convert a grpclib transport error to a GrpclibRpcError.
+    
+    Status errors keep their status code; dropped streams and connection
+    failures become UNAVAILABLE, which triggers the client's reconnect.
+    """
+    if isinstance(error, GRPCError):
+        code = getattr(grpc.StatusCode, error.status.name, grpc.StatusCode.UNKNOWN)
+        return GrpclibRpcError(code, error.message or error.status.name)
+    return GrpclibRpcError(grpc.StatusCode.UNAVAILABLE, str(error) or type(error).__name__)
+
+
+class _GrpclibStub:
+    """Wraps a grpclib service stub so unary calls raise GrpclibRpcError on failure."""
+    
+    def __init__(self, stub):
+        self.stub = stub
+    
+    def __getattr__(self, name: str):
+        method = getattr(self.stub, name)
+        
+        async def call(request, **kwargs) -> Any:
+            try:
+                return await method(request, **kwargs)
+            except TRANSPORT_ERRORS as error:
+                raise to_rpc_error(error) from error
+        
+        # Store the wrapper on the instance so later lookups skip __getattr__
+        setattr(self, name, call)
+        return call
+
+
+class EnSyncGrpclibClient(EnSyncClient):
+    """
+    EnSync gRPC client using grpclib instead of grpcio for the transport.
+    
+    grpclib runs the HTTP/2 connection directly on the asyncio event loop,
+    avoiding grpcio's crossings into its C-core for every call.
+    """
+    
+    def __init__(self, url: str, options: Dict[str, Any] = None):
+        """
+        Initialize EnSync grpclib client.
+        
+        Args:
+            url: gRPC server URL for EnSync service
+            options: Configuration options, as for EnSyncClient
+        """
+        super().__init__(url, options)
+        
+        # These configure grpcio channels and have no effect on grpclib connections
+        for option in ("channelOptions", "compression"):
+            if options and options.get(option):
+                logger.warning(f"{SERVICE_NAME} The grpclib transport ignores the {option} option")
+    
+    def _new_channel(self, target: str, secure: bool, channel_id: Optional[int] = None):
+        """Create a single grpclib channel to the target."""
+        # Every grpclib channel owns its own connection, so pooling needs no extra options
+        host, port = target.rsplit(":", 1)
+        return Channel(host, int(port), ssl=True if secure else None)
+    
+    def _new_stub(self, channel):
+        """Create the grpclib EnSync service stub for a channel."""
+        return _GrpclibStub(ensync_grpc.EnSyncServiceStub(channel))
+    
+    async def _close_channel(self, channel):
+        """Close a grpclib channel."""
+        channel.close()
+    
+    async def _open_event_stream(self, request) -> AsyncIterator:
+        """Open the server stream of events for a subscription request."""
+        try:
+            async with self._next_stub().stub.Subscribe.open() as stream:
+                await stream.send_message(request, end=True)
+                logger.debug(f"{SERVICE_NAME} grpclib subscription stream opened for {request.event_name}")
+                async for event_response in stream:
+                    yield event_response
+        except TRANSPORT_ERRORS as error:
+            raise to_rpc_error(error) from error
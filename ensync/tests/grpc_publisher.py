@@ -9,32 +9,198 @@ Environment Variables Required:
 - EVENT_TO_PUBLISH: Name of the event to publish (e.g., "test/event")
 - RECEIVER_IDENTIFICATION_NUMBER: Base64-encoded public key of the recipient
 - ENSYNC_GRPC_URL: gRPC server URL (default: localhost:50051)
+- ENSYNC_GRPC_BACKEND: Set to "grpclib" to use the grpclib transport (optional)
+- VERBOSE: Set to "1" to print every published batch (optional)
 """
 
 import asyncio
+import itertools
+import multiprocessing as mp
 import os
 import sys
 import time
-import random
-import json
-import importlib
 from dotenv import load_dotenv
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Add parent directory to path to import ensync module
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
 sys.path.insert(0, project_root)
 sys.path.insert(0, os.path.join(project_root, 'ensync-core'))
 
-# Force reload the grpc_client module to ensure the latest code is used
-from ensync import grpc_client
-importlib.reload(grpc_client)
-
-from ensync.grpc_client import EnSyncClient
+from ensync.grpc_client import EnSyncClient, get_engine
 from ensync.error import EnSyncError
 
 # Load environment variables
 load_dotenv()
 
+if os.getenv("ENSYNC_GRPC_BACKEND") == "grpclib":
+    from ensync.grpclib_client import EnSyncGrpclibClient as EnSyncClient
+
+
+# Publisher configuration
+num_processes = 1  # Number of publisher processes, each with its own event loop and clients
+num_workers = 1  # Number of parallel publisher workers per process
+num_events = 1
+batch_size = 500  # Events sent per publish_batch call
+verbose = os.getenv("VERBOSE", "").lower() in ("1", "true", "yes")  # Print every published batch
+
+
+# Generate a payload that results in an encrypted size of ~1MB.
+# Raw JSON size should be ~100KB as encryption adds ~9-10x overhead.
+# Only "name" varies per event, so the item fields are built once and copied.
+ITEM_TEMPLATES = [
+    {
+        "id": j,
+        "name": None,
+        "description": f"This is a detailed description for item {j}. " * 2,
+        "value": j * 1.5,
+        "active": j % 2 == 0
+    }
+    for j in range(200)  # 200 items is approx 100KB raw JSON
+]
+PAYLOAD_TEMPLATE = {"event_id": None, "timestamp": None, "message": None, "data": None}
+
+
+def build_payload(i: int, now=time.time):
+    """Generate a test payload for event index i from the prebuilt templates."""
+    data = []
+    append = data.append
+    for item in ITEM_TEMPLATES:
+        item = item.copy()
+        item["name"] = f"Item_{item['id']}_for_event_{i}"
+        append(item)
+
+    payload = PAYLOAD_TEMPLATE.copy()
+    payload["event_id"] = i + 1
+    payload["timestamp"] = now()
+    payload["message"] = f"Test event {i + 1} with large payload"
+    payload["data"] = data
+    return payload
+
+
+async def publish_chunk(process_id: int, start: int, end: int, config: dict):
+    """
+    Publish events [start, end) with this process's own workers and clients.
+    
+    Returns:
+        Statistics dict with successful/failed counts and duration lists
+    """
+    grpc_url = config["grpc_url"]
+    access_key = config["access_key"]
+    event_name = config["event_name"]
+    recipient = config["recipient"]
+    client_id, client_hash = config["session"]
+    
+    # Per-worker statistics, merged once all workers have finished
+    worker_stats = []
+    
+    # Bounded queue: the producer only builds batches as fast as workers consume them
+    publish_queue = asyncio.Queue(maxsize=2 * num_workers)
+
+    # Worker task - each worker has its own client instance
+    async def publisher_worker(worker_id: int):
+        durations = []
+        successful_publishes = 0
+        failed_publishes = 0
+        
+        # Each worker creates its own client instance for true parallelism
+        print(f"  Worker {process_id}.{worker_id}: Initializing client...")
+        worker_client = EnSyncClient(grpc_url, {
+            "enableLogging": False,  # Disable logging for workers to reduce noise
+            "heartbeatInterval": 15000,
+            "reconnectInterval": 3000,
+            "maxReconnectAttempts": 0,  # Disable auto-reconnect for workers
+            "recipientCacheSize": 1000,
+            "poolSize": 4  # Spread publishes over 4 HTTP/2 connections
+        })
+        
+        # Reuse the main client's session so workers skip the authentication round-trip
+        worker_client.set_session(client_id, client_hash)
+        
+        try:
+            try:
+                await worker_client.create_client(access_key)
+                # Resolve the fixed event name and recipient once instead of on every publish
+                publish_event = worker_client.prepare_publish(event_name, [recipient])
+                print(f"  Worker {process_id}.{worker_id}: Ready")
+            except Exception as e:
+                print(f"  Worker {process_id}.{worker_id}: Failed to connect - {e}")
+                # Mark all remaining events as failed for this worker
+                while True:
+                    event_data = await publish_queue.get()
+                    if event_data is None:
+                        break
+                    failed_publishes += len(event_data[1])
+                return
+            
+            while True:
+                event_data = await publish_queue.get()
+                if event_data is None:  # Sentinel for stopping
+                    break
+                
+                start_index, payloads = event_data
+                batch_label = f"events {start_index + 1}-{start_index + len(payloads)}"
+                start_time_event = time.perf_counter()
+                try:
+                    await asyncio.gather(*(publish_event(payload) for payload in payloads))
+                    duration = (time.perf_counter() - start_time_event) * 1000
+                    if verbose:
+                        print(f"  ✓ Worker {process_id}.{worker_id}: Published {batch_label} (took {duration:.2f}ms)")
+                    successful_publishes += len(payloads)
+                    durations.append(duration)
+                except EnSyncError as e:
+                    duration = (time.perf_counter() - start_time_event) * 1000
+                    print(f"  ✗ Worker {process_id}.{worker_id}: Failed {batch_label}: {e}")
+                    failed_publishes += len(payloads)
+                    durations.append(duration)
+                except Exception as e:
+                    duration = (time.perf_counter() - start_time_event) * 1000
+                    print(f"  ✗ Worker {process_id}.{worker_id}: Unexpected error on {batch_label}: {e}")
+                    failed_publishes += len(payloads)
+                    durations.append(duration)
+        finally:
+            # Clean up worker's client
+            worker_stats.append((successful_publishes, failed_publishes, durations, worker_client.encryption_durations))
+            await worker_client.close()
+            print(f"  Worker {process_id}.{worker_id}: Closed")
+
+    # Start multiple publisher workers
+    print(f"\nProcess {process_id}: starting {num_workers} parallel publisher workers for events {start + 1}-{end}...")
+    worker_tasks = [asyncio.create_task(publisher_worker(i)) for i in range(num_workers)]
+
+    # Enqueue events in chunks of batch_size
+    batch = []
+    for i in range(start, end):
+        batch.append(build_payload(i))
+        if len(batch) == batch_size or i == end - 1:
+            await publish_queue.put((i + 1 - len(batch), batch))
+            batch = []
+
+    # Stop all workers once they have drained the queue
+    for _ in range(num_workers):
+        await publish_queue.put(None)
+    
+    # Wait for all workers to finish
+    await asyncio.gather(*worker_tasks)
+    
+    return {
+        "successful": sum(stats[0] for stats in worker_stats),
+        "failed": sum(stats[1] for stats in worker_stats),
+        "durations": list(itertools.chain.from_iterable(stats[2] for stats in worker_stats)),
+        "encryption_durations": list(itertools.chain.from_iterable(stats[3] for stats in worker_stats))
+    }
+
+
+def run_publish_process(args):
+    """Entry point of a publisher process: run publish_chunk on a fresh event loop."""
+    if uvloop is not None:
+        uvloop.install()
+    return asyncio.run(publish_chunk(*args))
+
 
 async def main():
     """Main function to test gRPC event publishing."""
@@ -63,20 +229,22 @@ async def main():
     
     print(f"\nConfiguration:")
     print(f"  gRPC URL: {grpc_url}")
+    print(f"  Transport: {EnSyncClient.__name__}")
     print(f"  Event Name: {event_name}")
     print(f"  Recipient: {recipient[:20]}...{recipient[-20:]}")
+    print(f"  Processes: {num_processes}, Workers per Process: {num_workers}")
     print()
     
     try:
         # Initialize gRPC client
         print("Initializing EnSync gRPC client...")
-        ensync_client = EnSyncClient(grpc_url, {
+        ensync_client = get_engine(grpc_url, {
             "enableLogging": True,  # Enable logging to debug
             "heartbeatInterval": 15000,  # 15 seconds
             "reconnectInterval": 3000,  # 3 seconds
             "maxReconnectAttempts": 3,
             "recipientCacheSize": 1000
-        })
+        }, EnSyncClient)
         
         print("Creating gRPC client connection...")
         client = await ensync_client.create_client(access_key)
@@ -89,127 +257,41 @@ async def main():
         print("Successfully created and authenticated gRPC client")
         print()
         
-        # Track statistics
-        durations = []
-        total_start_time = time.time()
-        successful_publishes = 0
-        failed_publishes = 0
-        stats_lock = asyncio.Lock()
+        config = {
+            "grpc_url": grpc_url,
+            "access_key": access_key,
+            "event_name": event_name,
+            "recipient": recipient,
+            "session": (ensync_client.client_id, ensync_client.client_hash)
+        }
         
-        # Configuration for parallel workers
-        num_workers = 1  # Number of parallel publisher workers
-        num_events = 1
+        # Split the events into one contiguous range per process
+        chunk_size = -(-num_events // num_processes)
+        chunks = [
+            (process_id, start, min(start + chunk_size, num_events), config)
+            for process_id, start in enumerate(range(0, num_events, chunk_size))
+        ]
         
-        # Create a queue for publishing events
-        publish_queue = asyncio.Queue()
-
-        # Worker task - each worker has its own client instance
-        async def publisher_worker(worker_id: int):
-            nonlocal successful_publishes, failed_publishes
-            
-            # Each worker creates its own client instance for true parallelism
-            print(f"  Worker {worker_id}: Initializing client...")
-            worker_client = EnSyncClient(grpc_url, {
-                "enableLogging": False,  # Disable logging for workers to reduce noise
-                "heartbeatInterval": 15000,
-                "reconnectInterval": 3000,
-                "maxReconnectAttempts": 0,  # Disable auto-reconnect for workers
-                "recipientCacheSize": 1000
-            })
-            
-            try:
-                try:
-                    await worker_client.create_client(access_key)
-                    print(f"  Worker {worker_id}: Ready")
-                except Exception as e:
-                    print(f"  Worker {worker_id}: Failed to connect - {e}")
-                    # Mark all remaining events as failed for this worker
-                    while True:
-                        event_data = await publish_queue.get()
-                        if event_data is None:
-                            publish_queue.task_done()
-                            break
-                        async with stats_lock:
-                            failed_publishes += 1
-                        publish_queue.task_done()
-                    return
-                
-                while True:
-                    event_data = await publish_queue.get()
-                    if event_data is None:  # Sentinel for stopping
-                        publish_queue.task_done()
-                        break
-                    
-                    index, payload = event_data
-                    start_time_event = time.time()
-                    try:
-                        response = await worker_client.publish(event_name, [recipient], payload)
-                        duration = (time.time() - start_time_event) * 1000
-                        print(f"  ✓ Worker {worker_id}: Published event {index + 1} (took {duration:.2f}ms)")
-                        async with stats_lock:
-                            successful_publishes += 1
-                            durations.append(duration)
-                    except EnSyncError as e:
-                        duration = (time.time() - start_time_event) * 1000
-                        print(f"  ✗ Worker {worker_id}: Failed event {index + 1}: {e}")
-                        async with stats_lock:
-                            failed_publishes += 1
-                            durations.append(duration)
-                    except Exception as e:
-                        duration = (time.time() - start_time_event) * 1000
-                        print(f"  ✗ Worker {worker_id}: Unexpected error on event {index + 1}: {e}")
-                        async with stats_lock:
-                            failed_publishes += 1
-                            durations.append(duration)
-                    
-                    publish_queue.task_done()
-            finally:
-                # Clean up worker's client
-                await worker_client.close()
-                print(f"  Worker {worker_id}: Closed")
-
-        # Start multiple publisher workers
-        print(f"\nStarting {num_workers} parallel publisher workers...")
-        worker_tasks = [asyncio.create_task(publisher_worker(i)) for i in range(num_workers)]
-
-        # Enqueue events
-        print(f"Enqueuing {num_events} test events...")
+        print(f"Publishing {num_events} test events in batches of {batch_size}...")
+        total_start_time = time.perf_counter()
         
-        for i in range(num_events):
-            # Generate a payload that results in an encrypted size of ~1MB.
-            # Raw JSON size should be ~100KB as encryption adds ~9-10x overhead.
-            large_data = []
-            for j in range(200):  # 200 items is approx 100KB raw JSON
-                large_data.append({
-                    "id": j,
-                    "name": f"Item_{j}_for_event_{i}",
-                    "description": f"This is a detailed description for item {j}. " * 2,
-                    "value": j * 1.5,
-                    "active": j % 2 == 0
-                })
-
-            payload = {
-                "event_id": i + 1,
-                "timestamp": time.time(),
-                "message": f"Test event {i + 1} with large payload",
-                "data": large_data
-            }
-            await publish_queue.put((i, payload))
-
-        # Wait for the queue to be processed
-        await publish_queue.join()
-
-        # Stop all workers
-        for _ in range(num_workers):
-            await publish_queue.put(None)
+        if len(chunks) == 1:
+            results = [await publish_chunk(*chunks[0])]
+        else:
+            # Separate processes escape the GIL; only the final statistics cross process boundaries
+            with mp.get_context("spawn").Pool(len(chunks)) as pool:
+                results = await asyncio.get_event_loop().run_in_executor(None, pool.map, run_publish_process, chunks)
+        
+        total_duration = (time.perf_counter() - total_start_time) * 1000
         
-        # Wait for all workers to finish
-        await asyncio.gather(*worker_tasks)
+        successful_publishes = sum(result["successful"] for result in results)
+        failed_publishes = sum(result["failed"] for result in results)
+        durations = list(itertools.chain.from_iterable(result["durations"] for result in results))
+        encryption_durations = list(itertools.chain.from_iterable(result["encryption_durations"] for result in results))
 
         print(f"\nCompleted: {successful_publishes} successful, {failed_publishes} failed")
         
         # Calculate statistics
-        total_duration = (time.time() - total_start_time) * 1000
         avg_duration = sum(durations) / len(durations) if durations else 0
         min_duration = min(durations) if durations else 0
         max_duration = max(durations) if durations else 0
@@ -223,19 +305,20 @@ async def main():
         print(f"  Successful: {successful_publishes}")
         print(f"  Failed: {failed_publishes}")
         print(f"  Total Time: {total_duration:.2f}ms ({total_duration/1000:.2f}s)")
-        print(f"  Average Duration per Event: {avg_duration:.2f}ms")
+        print(f"  Average Duration per Batch: {avg_duration:.2f}ms")
         print(f"  Min Duration: {min_duration:.2f}ms")
         print(f"  Max Duration: {max_duration:.2f}ms")
         print(f"  Overall Throughput: {overall_throughput:.2f} events/sec")
         print("=" * 60)
 
         # Print encryption statistics
-        if ensync_client.encryption_durations:
+        if encryption_durations:
             print("\nEncryption Statistics:")
-            print(f"  Average Encryption Latency: {sum(ensync_client.encryption_durations) / len(ensync_client.encryption_durations):.2f}ms")
-            print(f"  Min Encryption Latency: {min(ensync_client.encryption_durations):.2f}ms")
-            print(f"  Max Encryption Latency: {max(ensync_client.encryption_durations):.2f}ms")
+            print(f"  Average Encryption Latency: {sum(encryption_durations) / len(encryption_durations):.2f}ms")
+            print(f"  Min Encryption Latency: {min(encryption_durations):.2f}ms")
+            print(f"  Max Encryption Latency: {max(encryption_durations):.2f}ms")
             print("=" * 60)
+        sys.stdout.flush()
         
         # Close connection
         print("\nClosing gRPC connection...")
@@ -255,5 +338,10 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Block-buffer stdout so each print is not flushed; prompts and summaries flush explicitly
+    sys.stdout.reconfigure(line_buffering=False, write_through=False)
+    # Use uvloop's faster event loop when it is installed
+    if uvloop is not None:
+        uvloop.install()
     exit_code = asyncio.run(main())
     sys.exit(exit_code)
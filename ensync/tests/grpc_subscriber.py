@@ -9,18 +9,29 @@ Environment Variables Required:
 - EVENT_TO_SUBSCRIBE: Name of the event to subscribe to (e.g., "test/event")
 - APP_SECRET_KEY: Secret key for decrypting messages (optional)
 - ENSYNC_GRPC_URL: gRPC server URL (default: localhost:50051)
+- LOG_LEVEL: Set to DEBUG to print every received event (default: INFO)
 """
 
 import asyncio
+import logging
+import math
 import os
+import queue
+import signal
 import sys
 import time
+from logging.handlers import QueueHandler, QueueListener
 from dotenv import load_dotenv
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Add parent directory to path to import ensync module
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
-from ensync.grpc_client import EnSyncClient
+from ensync.grpc_client import get_engine
 from ensync.error import EnSyncError
 
 # Load environment variables
@@ -30,8 +41,23 @@ load_dotenv()
 # Global statistics
 event_count = 0
 start_time = None
-event_times = []
-processing_times = []  # Track processing completion times
+# Timestamps are monotonic time.perf_counter_ns() values, converted only when reported.
+# Interval statistics are updated as events arrive instead of keeping every timestamp.
+prev_event_time = None
+interval_sum = 0
+interval_min = math.inf
+interval_max = 0
+
+SUMMARY_INTERVAL = 1000  # Log a summary line every this many events
+
+# Per-event output is logged at DEBUG (set LOG_LEVEL=DEBUG to see it) and written by a
+# QueueListener thread, so formatting and console I/O stay off the event loop
+log_queue = queue.SimpleQueue()
+log_listener = QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+logger = logging.getLogger("ensync.grpc_subscriber")
+logger.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+logger.addHandler(QueueHandler(log_queue))
+logger.propagate = False
 
 
 # Get configuration from environment
@@ -40,32 +66,54 @@ access_key = os.getenv("ENSYNC_ACCESS_KEY")
 event_name = os.getenv("EVENT_TO_SUBSCRIBE")
 app_secret_key = os.getenv("APP_SECRET_KEY")
 
-# Initialize gRPC client
-ensync_client = EnSyncClient(grpc_url, {
+# Initialize gRPC client (shared with any other user of the same URL and options)
+ensync_client = get_engine(grpc_url, {
     "enableLogging": True,
     "heartbeatInterval": 15000,
     "reconnectInterval": 3000,
     "maxReconnectAttempts": 3
 })
 
-@ensync_client.subscribe(event_name, auto_ack=True, app_secret_key=app_secret_key)
+@ensync_client.subscribe(event_name, auto_ack=True)  # Decrypts with the client-wide appSecretKey
 # @ensync_client.subscribe("another/event", auto_ack=True)
 async def handle_event(event):
     """Handles incoming events from subscriptions."""
-    global event_count, event_times, processing_times
+    global event_count, prev_event_time, interval_sum, interval_min, interval_max
     event_count += 1
-    event_time = time.time()
-    event_times.append(event_time)
-
-    print(f"\n[Event #{event_count}] Received at {time.strftime('%H:%M:%S')}")
-    print(f"  Event Name: {event.get('eventName')}")
-    print(f"  Payload: {event.get('payload')}")
-    print("-" * 60)
-
-    processing_times.append(time.time())
+    event_time = time.perf_counter_ns()
+
+    if prev_event_time is not None:
+        interval = event_time - prev_event_time
+        interval_sum += interval
+        if interval < interval_min:
+            interval_min = interval
+        if interval > interval_max:
+            interval_max = interval
+    prev_event_time = event_time
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "\n[Event #%d] Received at %s\n  Event Name: %s\n  Idem: %s, Block: %s\n  Payload: %s\n%s",
+            event_count, time.strftime('%H:%M:%S'), event.get('eventName'),
+            event.get('idem'), event.get('block'), event.get('payload'), "-" * 60
+        )
+    if event_count % SUMMARY_INTERVAL == 0:
+        elapsed = (event_time - (start_time or event_time)) / 1e9
+        rate = event_count / elapsed if elapsed > 0 else 0
+        logger.info("[Summary] %d events received (%.2f events/sec)", event_count, rate)
+
+def install_stop_handlers(stop_event: asyncio.Event):
+    """Set stop_event on Ctrl+C or SIGTERM to gracefully exit."""
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop_event.set)
+        except NotImplementedError:
+            # Windows event loops do not support add_signal_handler
+            signal.signal(sig, lambda *_: loop.call_soon_threadsafe(stop_event.set))
 
 async def main():
-    """Main function to connect the client and run indefinitely."""
+    """Main function to connect the client and run until stopped."""
     global start_time
 
     print("=" * 60)
@@ -81,21 +129,25 @@ async def main():
     print(f"  Subscribing to: '{event_name}' and 'another/event'")
     print()
 
+    log_listener.start()
+
     try:
         print("Connecting and authenticating client...")
         client_options = {"appSecretKey": app_secret_key} if app_secret_key else {}
         await ensync_client.create_client(access_key, client_options)
 
-        if not ensync_client._state["is_authenticated"]:
+        if not ensync_client.is_authenticated:
             print("Authentication failed.")
             return 1
 
-        print("✓ Client connected. Waiting for events... (Press Ctrl+C to stop)")
-        start_time = time.time()
-        await asyncio.Future()  # Run indefinitely
+        print("✓ Client connected. Waiting for events... (Press Ctrl+C to stop)", flush=True)
+        start_time = time.perf_counter_ns()
 
-    except KeyboardInterrupt:
+        stop_event = asyncio.Event()
+        install_stop_handlers(stop_event)
+        await stop_event.wait()
         print("\n\nShutting down...")
+
     except EnSyncError as e:
         print(f"\n✗ EnSync Error: {e}")
         return 1
@@ -105,25 +157,37 @@ async def main():
         traceback.print_exc()
         return 1
     finally:
-        if ensync_client._state["is_connected"]:
+        if ensync_client.is_connected:
             await ensync_client.close()
+        # Stopping the listener writes out any records still queued
+        log_listener.stop()
         print_statistics()
 
 def print_statistics():
     """Prints the event processing statistics."""
     print("=" * 60)
     if event_count > 0:
-        total_time = time.time() - start_time
+        total_time = (time.perf_counter_ns() - start_time) / 1e9
         avg_rate = event_count / total_time if total_time > 0 else 0
         print("\nSubscription Statistics:")
         print(f"  Total Events Received: {event_count}")
         print(f"  Total Time: {total_time:.2f}s")
         print(f"  Overall Receive Rate: {avg_rate:.2f} events/sec")
+        if event_count > 1:
+            print(f"  Average Interval: {interval_sum / (event_count - 1) / 1e6:.2f}ms")
+            print(f"  Min Interval: {interval_min / 1e6:.2f}ms")
+            print(f"  Max Interval: {interval_max / 1e6:.2f}ms")
     else:
         print("\nNo events received during this session.")
     print("=" * 60)
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
+    # Block-buffer stdout so each print is not flushed; prompts and summaries flush explicitly
+    sys.stdout.reconfigure(line_buffering=False, write_through=False)
+    # Use uvloop's faster event loop when it is installed
+    if uvloop is not None:
+        uvloop.install()
     exit_code = asyncio.run(main())
     sys.exit(exit_code)
@@ -1,15 +1,16 @@
 import asyncio
 import os
 import sys
-import importlib
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 # Add parent directory to path to import ensync module FIRST
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
-from ensync import grpc_client
-importlib.reload(grpc_client)
-
-from ensync.grpc_client import EnSyncGrpcClient
+from ensync.grpc_client import get_engine
 from ensync.error import EnSyncError
 
 
@@ -17,7 +18,7 @@ grpc_url = "grpcs://node.gms.ensync.cloud"
 app_key = "J1ic4fbQzJq7YkgSsB3kZmkeMNbZsgcs"
 
 async def main():
-  ensync_client = EnSyncGrpcClient(grpc_url, {"enableLogging": True})
+  ensync_client = get_engine(grpc_url, {"enableLogging": True, "poolSize": 4})
 
   print("Creating gRPC client connection...")
   client = await ensync_client.create_client(app_key)
@@ -30,4 +31,7 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Use uvloop's faster event loop when it is installed
+    if uvloop is not None:
+        uvloop.install()
     asyncio.run(main())
\ No newline at end of file
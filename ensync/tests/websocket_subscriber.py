@@ -8,7 +8,21 @@ import signal
 import sys
 from dotenv import load_dotenv
 
-from ensync import EnSyncEngine
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+from ensync import EnSyncWebSocketEngine
+
+# Load environment variables
+load_dotenv()
+
+# Get configuration from environment
+access_key = os.getenv("CLIENT_ACCESS_KEY")
+event_name = os.getenv("EVENT_TO_SUBSCRIBE", "progo/bicycles/coordinates")
+app_secret_key = os.getenv("APP_SECRET_KEY")
+replay_event_id = os.getenv("REPLAY_EVENT_ID")
 
 # Track statistics
 total_events_received = 0
@@ -16,49 +30,44 @@ total_events_acknowledged = 0
 processed_events = []
 event_count = -1
 
-# Flag to control the main loop
-running = True
-
-def handle_sigint(sig, frame):
-    """Handle Ctrl+C to gracefully exit."""
-    global running
-    print("\nUnsubscribing and closing connection...")
-    running = False
+def install_stop_handlers(stop_event: asyncio.Event):
+    """Set stop_event on Ctrl+C or SIGTERM to gracefully exit."""
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop_event.set)
+        except NotImplementedError:
+            # Windows event loops do not support add_signal_handler
+            signal.signal(sig, lambda *_: loop.call_soon_threadsafe(stop_event.set))
 
 async def main():
     """Run the WebSocket subscriber test."""
-    global total_events_received, total_events_acknowledged, processed_events, event_count, running
-    
-    # Set up signal handler
-    signal.signal(signal.SIGINT, handle_sigint)
+    global total_events_received, total_events_acknowledged, processed_events, event_count
     
-    # Load environment variables
-    load_dotenv()
+    # Set up signal handlers
+    stop_event = asyncio.Event()
+    install_stop_handlers(stop_event)
     
     # Check required environment variables
-    if not os.getenv("CLIENT_ACCESS_KEY"):
+    if not access_key:
         print("ERROR: CLIENT_ACCESS_KEY environment variable is not set")
         return 1
     
     try:
-        # Get event name from environment or use default
-        event_name = os.getenv("EVENT_TO_SUBSCRIBE", "progo/bicycles/coordinates")
-        
         # Initialize EnSync client
-        ensync_client = EnSyncEngine("wss://node.gms.ensync.cloud")
+        ensync_client = EnSyncWebSocketEngine("wss://node.gms.ensync.cloud")
         
         # Create client with optional app secret key
         client_options = {}
-        if os.getenv("APP_SECRET_KEY"):
-            client_options["appSecretKey"] = os.getenv("APP_SECRET_KEY")
+        if app_secret_key:
+            client_options["appSecretKey"] = app_secret_key
             
-        await ensync_client.create_client(os.getenv("CLIENT_ACCESS_KEY"), client_options if client_options else None)
+        await ensync_client.create_client(access_key, client_options if client_options else None)
         
         # Subscribe to the event with autoAck set to false for manual acknowledgment
         subscription = await ensync_client.subscribe(event_name, {"autoAck": False})
         
         # Optionally replay a specific event if ID is provided
-        replay_event_id = os.getenv("REPLAY_EVENT_ID")
         if replay_event_id:
             replay_result = await subscription["replay"](replay_event_id)
             print("Replay Result:", replay_result)
@@ -97,11 +106,11 @@ async def main():
         remove_handler = subscription["on"](event_handler)
         
         # Keep the script running until Ctrl+C
-        print(f"Subscribed to {event_name}. Press Ctrl+C to exit.")
+        print(f"Subscribed to {event_name}. Press Ctrl+C to exit.", flush=True)
         
-        # Main loop
-        while running:
-            await asyncio.sleep(1)
+        # Wait until Ctrl+C or SIGTERM
+        await stop_event.wait()
+        print("\nUnsubscribing and closing connection...")
         
         # Clean up
         remove_handler()
@@ -111,6 +120,7 @@ async def main():
         print("Total Events Received:", total_events_received)
         print("Total Events Acknowledged:", total_events_acknowledged)
         print("Processed Events:", processed_events)
+        sys.stdout.flush()
         
         return 0
         
@@ -121,4 +131,9 @@ async def main():
         return 1
 
 if __name__ == "__main__":
+    # Block-buffer stdout so each print is not flushed; prompts and summaries flush explicitly
+    sys.stdout.reconfigure(line_buffering=False, write_through=False)
+    # Use uvloop's faster event loop when it is installed
+    if uvloop is not None:
+        uvloop.install()
     asyncio.run(main())
@@ -850,6 +850,16 @@ class EnSyncClient:
                 raise error
             raise EnSyncError(str(error), "EnSyncReplayError")
     
+    @property
+    def is_connected(self) -> bool:
+        """Check if the client is connected."""
+        return self._state["isConnected"]
+    
+    @property
+    def is_authenticated(self) -> bool:
+        """Check if the client is authenticated."""
+        return self._state["isAuthenticated"]
+    
     def get_client_public_key(self) -> str:
         """Get the client's public key (client hash)."""
         return self.__config.get("clientHash")
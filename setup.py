@@ -16,7 +16,9 @@ setup(
             "websocket.py",
             "grpc_client.py",
             "ensync_pb2.py",
-            "ensync_pb2_grpc.py"
+            "ensync_pb2_grpc.py",
+            "grpclib_client.py",
+            "ensync_grpc.py"
         ]
     },
     install_requires=[
@@ -28,7 +30,16 @@ setup(
     extras_require={
         "dev": [
             "python-dotenv>=0.19.0",
-        ]
+        ],
+        "grpclib": [
+            "grpclib>=0.4.0",
+        ],
+        "orjson": [
+            "orjson>=3.6.0",
+        ],
+        "uvloop": [
+            "uvloop>=0.17.0; sys_platform != 'win32'",
+        ],
     },
     author="EnSync Team",
     author_email="dev@ensync.cloud",
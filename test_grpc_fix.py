@@ -4,13 +4,22 @@ Test script to verify the gRPC client fix for the close() method.
 This ensures the TypeError with should_reconnect parameter is resolved.
 """
 import asyncio
+import base64
+import itertools
+import json
+import logging
+import math
 import sys
 import os
+from types import SimpleNamespace
+
+from nacl.signing import SigningKey
 
 # Add the parent directory to the path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from ensync.grpc_client import EnSyncClient
+from ensync.error import EnSyncError
+from ensync.grpc_client import EnSyncClient, _dumps, _loads, get_engine
 
 
 async def test_close_method():
@@ -70,6 +79,350 @@ async def test_pythonic_naming():
     return True
 
 
+def make_keys():
+    """Return a recipient public key and its secret key, both base64 encoded."""
+    signing_key = SigningKey.generate()
+    recipient = base64.b64encode(bytes(signing_key.verify_key)).decode()
+    secret_key = base64.b64encode(bytes(signing_key) + bytes(signing_key.verify_key)).decode()
+    return recipient, secret_key
+
+
+class FakeStub:
+    """Stand-in for the service stub that decrypts each published payload to build its event id."""
+    
+    def __init__(self, client, secret_key):
+        self.client = client
+        self.secret_key = secret_key
+        self.calls = 0
+    
+    async def PublishEvent(self, request):
+        self.calls += 1
+        index = self.client._decrypt_payload(request.payload, self.secret_key)["payload"]["index"]
+        # Later payloads finish first, so results only line up if they are reordered
+        await asyncio.sleep(0.001 * (10 - index))
+        if index == 7:
+            return SimpleNamespace(success=False, event_idem="", error_message="rejected")
+        return SimpleNamespace(success=True, event_idem=f"idem-{index}", error_message="")
+
+
+def fake_client(secret_key, options=None):
+    """Return an authenticated client whose RPCs go to a FakeStub."""
+    client = EnSyncClient("localhost:50051", options)
+    client._state["is_authenticated"] = True
+    client._config["client_id"] = "client-1"
+    client._stub = FakeStub(client, secret_key)
+    client._stubs = [client._stub]
+    client._stub_cycle = itertools.cycle(client._stubs)
+    return client
+
+
+async def test_publish_batch():
+    """Test that publish_batch returns ids in payload order and propagates failures."""
+    print("\nTesting batch publishing...")
+    
+    recipient, secret_key = make_keys()
+    client = fake_client(secret_key)
+    options = {"useHybridEncryption": False}
+    
+    payloads = [{"index": i} for i in range(5)]
+    event_ids = await client.publish_batch("test/event", [recipient], payloads, None, options)
+    assert event_ids == [f"idem-{i}" for i in range(5)], "publish_batch should return ids in payload order"
+    
+    try:
+        await client.publish_batch("test/event", [recipient], [{"index": 6}, {"index": 7}], None, options)
+        assert False, "publish_batch should raise when an event is rejected"
+    except EnSyncError as error:
+        assert error.error_type == "EnSyncPublishError", "Rejected events should raise EnSyncPublishError"
+    
+    print("✅ Batches return ids in order and propagate errors!")
+    return True
+
+
+async def test_channel_pool():
+    """Test that poolSize opens several channels and spreads publishes across them."""
+    print("\nTesting the channel pool...")
+    
+    recipient, secret_key = make_keys()
+    client = fake_client(secret_key, {"poolSize": 3})
+    client._create_channels("localhost:50051", False)
+    assert len(client._channels) == 3, "poolSize should open one channel per pool slot"
+    
+    client._stubs = [FakeStub(client, secret_key) for _ in client._stubs]
+    client._stub_cycle = itertools.cycle(client._stubs)
+    stubs = client._stubs
+    payloads = [{"index": i} for i in range(6)]
+    await client.publish_batch("test/event", [recipient], payloads, None, {"useHybridEncryption": False})
+    assert [stub.calls for stub in stubs] == [2, 2, 2], "Publishes should be spread round-robin over the pool"
+    
+    await client.close()
+    print("✅ Publishes are spread across the channel pool!")
+    return True
+
+
+async def test_session_reuse():
+    """Test that injected and cached sessions are reused until close to expiry."""
+    print("\nTesting session reuse...")
+    
+    client = EnSyncClient("localhost:50051")
+    client._config["access_key"] = "test-access-key"
+    assert client._get_reusable_session() is None, "No session should be available initially"
+    
+    client.set_session("client-1", "hash-1")
+    assert client._get_reusable_session()[:2] == ("client-1", "hash-1"), "Injected session should be reused"
+    
+    client.set_session("client-1", "hash-1", ttl=10000)
+    assert client._get_reusable_session() is None, "Session close to expiry should not be reused"
+    
+    cached_client = EnSyncClient("localhost:50051", {"sessionCacheTtl": 600000})
+    cached_client._config["access_key"] = "test-access-key"
+    cached_client._config["client_id"] = "client-2"
+    cached_client._store_session("client-2", "hash-2")
+    
+    uncached_client = EnSyncClient("localhost:50051")
+    uncached_client._config["access_key"] = "test-access-key"
+    assert uncached_client._get_reusable_session() is None, "Clients without sessionCacheTtl should not share sessions"
+    
+    other_client = EnSyncClient("localhost:50051", {"sessionCacheTtl": 600000})
+    other_client._config["access_key"] = "test-access-key"
+    assert other_client._get_reusable_session()[:2] == ("client-2", "hash-2"), "Cached session should be shared"
+    
+    cached_client._invalidate_session()
+    assert other_client._get_reusable_session() is None, "Invalidated session should not be shared"
+    
+    print("✅ Sessions are reused and invalidated correctly!")
+    return True
+
+
+async def test_batched_delivery():
+    """Test that batching handlers get full batches, delayed partial batches, and leftovers on close."""
+    print("\nTesting batched event delivery...")
+    
+    client = EnSyncClient("localhost:50051")
+    client._state["is_authenticated"] = True
+    acked = []
+    
+    async def fake_ack(event_idem, block, event_name):
+        acked.append(event_idem)
+        return "ok"
+    
+    client._ack = fake_ack
+    batches = []
+    
+    async def handler(events):
+        batches.append([event["idem"] for event in events])
+    
+    client._on("test/event", handler, None, True, batch_size=3, max_delay_ms=50)
+    handler_obj = next(iter(client._subscriptions["test/event"]))
+    
+    def event(idem):
+        return {"idem": idem, "block": 1, "eventName": "test/event", "payload": {}}
+    
+    for idem in ("e1", "e2", "e3"):
+        await client._buffer_event(handler_obj, event(idem))
+    assert batches == [["e1", "e2", "e3"]], "A full batch should be delivered immediately"
+    assert sorted(acked) == ["e1", "e2", "e3"], "Every event in the batch should be acknowledged"
+    
+    await client._buffer_event(handler_obj, event("e4"))
+    assert len(batches) == 1, "A partial batch should wait for the delay"
+    await asyncio.sleep(0.1)
+    assert batches[-1] == ["e4"], "A partial batch should be delivered after the delay"
+    
+    await client._buffer_event(handler_obj, event("e5"))
+    await client._buffer_event(handler_obj, event("e6"))
+    await client.close()
+    assert batches[-1] == ["e5", "e6"], "close() should deliver pending partial batches"
+    assert handler_obj.flush_task is None, "close() should stop the flush timer"
+    await asyncio.sleep(0.1)
+    assert len(batches) == 3 and sorted(acked[-2:]) == ["e5", "e6"], "Nothing should be delivered after close()"
+    
+    print("✅ Batches are delivered by size, by delay, and on close!")
+    return True
+
+
+async def test_recipient_key_cache():
+    """Test that converted recipient keys are cached and evicted in LRU order."""
+    print("\nTesting recipient key cache...")
+    
+    client = EnSyncClient("localhost:50051")
+    client._recipient_key_cache_size = 2
+    recipients = [make_keys()[0] for _ in range(3)]
+    
+    keys = client._get_recipient_key(recipients[0])
+    assert client._get_recipient_key(recipients[0]) is keys, "Cached keys should be reused"
+    
+    client._get_recipient_key(recipients[1])
+    client._get_recipient_key(recipients[2])
+    assert recipients[0] not in client._recipient_key_cache, "Least recently used key should be evicted"
+    
+    print("✅ Recipient keys are cached!")
+    return True
+
+
+async def test_prepare_publish():
+    """Test that prepared publish functions return ids per payload and propagate failures."""
+    print("\nTesting prepared publishing...")
+    
+    recipient, secret_key = make_keys()
+    client = fake_client(secret_key)
+    publish_event = client.prepare_publish("test/event", [recipient], None, {"useHybridEncryption": False})
+    
+    event_ids = await asyncio.gather(*(publish_event({"index": i}) for i in range(5)))
+    assert event_ids == [f"idem-{i}" for i in range(5)], "Prepared publishes should return their own ids"
+    
+    try:
+        await publish_event({"index": 7})
+        assert False, "Prepared publish should raise when an event is rejected"
+    except EnSyncError as error:
+        assert error.error_type == "EnSyncPublishError", "Rejected events should raise EnSyncPublishError"
+    
+    print("✅ Prepared publishes return ids and propagate errors!")
+    return True
+
+
+async def test_get_engine():
+    """Test that get_engine shares one engine per URL and options."""
+    print("\nTesting shared engines...")
+    
+    engine = get_engine("localhost:50051", {"poolSize": 2})
+    assert get_engine("localhost:50051", {"poolSize": 2}) is engine, "Same URL and options should share an engine"
+    assert get_engine("localhost:50051", {"poolSize": 3}) is not engine, "Different options should get their own engine"
+    assert get_engine("localhost:50052", {"poolSize": 2}) is not engine, "Different URLs should get their own engine"
+    
+    print("✅ Engines are shared per URL and options!")
+    return True
+
+
+async def test_decryption_key_cache():
+    """Test that the decryption key is derived once per app secret key."""
+    print("\nTesting decryption key cache...")
+    
+    client = EnSyncClient("localhost:50051")
+    _, secret_key = make_keys()
+    _, other_secret_key = make_keys()
+    
+    private_key = client._get_decryption_key(secret_key)
+    assert client._get_decryption_key(secret_key) is private_key, "Derived keys should be reused"
+    assert client._get_decryption_key(other_secret_key) is not private_key, "Each secret key should get its own key"
+    
+    print("✅ Decryption keys are cached!")
+    return True
+
+
+async def test_get_engine_after_close():
+    """Test that closed engines are not shared again and reconnect when reused."""
+    print("\nTesting shared engines after close...")
+    
+    engine = get_engine("localhost:50053")
+    await engine.close()
+    assert not engine._state["should_reconnect"], "A permanent close should turn off reconnects"
+    
+    new_engine = get_engine("localhost:50053")
+    assert new_engine is not engine, "A closed engine should not be shared again"
+    
+    async def fake_connect():
+        pass
+    
+    for client in (new_engine, engine):
+        client.connect = fake_connect
+        await client.create_client("test-access-key")
+        assert client._state["should_reconnect"], "create_client should turn reconnects back on"
+    
+    print("✅ Closed engines are replaced and reconnect when reused!")
+    return True
+
+
+async def test_payload_serialization():
+    """Test that payloads serialize the same way with or without orjson."""
+    print("\nTesting payload serialization...")
+    
+    payload = {"reading": float("nan"), "limit": float("inf"), "unit": None, "values": [1, 2.5]}
+    assert _dumps(payload).decode() == json.dumps(payload), "NaN and Infinity should be sent as json.dumps sends them"
+    assert math.isnan(_loads(_dumps(payload))["reading"]), "NaN should survive a round trip"
+    
+    recipient, _ = make_keys()
+    client = EnSyncClient("localhost:50051")
+    client._config["client_id"] = "client-1"
+    payload = {"reading": 1.5, "tags": ["a", "b"]}
+    request = client._build_publish_requests("test/event", [recipient], payload, "{}", False)[0]
+    byte_size = json.loads(request.payload_metadata)["byte_size"]
+    assert byte_size == len(json.dumps(payload).encode('utf-8')), "byte_size should match the WebSocket client"
+    
+    print("✅ Payloads serialize consistently!")
+    return True
+
+
+async def test_handlers_get_own_payload():
+    """Test that handlers sharing a decryption key decrypt once but get separate payloads."""
+    print("\nTesting payload isolation between handlers...")
+    
+    recipient, secret_key = make_keys()
+    client = EnSyncClient("localhost:50051")
+    client._config["client_id"] = "client-1"
+    request = client._build_publish_requests("test/event", [recipient], {"count": 1}, "{}", False)[0]
+    
+    async def fake_stream():
+        yield SimpleNamespace(event_idem="e1", event_name="test/event", partition_block=0,
+                              payload=request.payload, sender="", metadata="")
+    
+    client._open_event_stream = lambda _: fake_stream()
+    decrypt_calls = []
+    decrypt_payload_json = client._decrypt_payload_json
+    
+    def counting_decrypt(*args):
+        decrypt_calls.append(args)
+        return decrypt_payload_json(*args)
+    
+    client._decrypt_payload_json = counting_decrypt
+    seen = []
+    
+    def first_handler(event):
+        event["payload"]["count"] += 1
+        seen.append(event["payload"]["count"])
+    
+    def second_handler(event):
+        event["payload"]["count"] += 1
+        seen.append(event["payload"]["count"])
+    
+    client._on("test/event", first_handler, secret_key, False)
+    client._on("test/event", second_handler, secret_key, False)
+    await client._handle_event_stream("test/event", None, {})
+    
+    assert len(decrypt_calls) == 1, "Handlers sharing a key should share one decryption"
+    assert seen == [2, 2], "A handler's changes to its payload should not reach other handlers"
+    
+    print("✅ Handlers get their own payloads!")
+    return True
+
+
+async def test_grpclib_transport():
+    """Test that the grpclib transport caches stub wrappers and warns about grpcio-only options."""
+    print("\nTesting the grpclib transport...")
+    
+    from ensync.grpclib_client import EnSyncGrpclibClient, _GrpclibStub
+    
+    stub = _GrpclibStub(SimpleNamespace(PublishEvent=None))
+    assert stub.PublishEvent is stub.PublishEvent, "Wrapped stub methods should be built once"
+    
+    records = []
+    handler = logging.Handler()
+    handler.emit = records.append
+    grpc_logger = logging.getLogger("EnSync:gRPC")
+    level = grpc_logger.level
+    grpc_logger.addHandler(handler)
+    grpc_logger.setLevel(logging.WARNING)
+    try:
+        EnSyncGrpclibClient("localhost:50051")
+        assert not records, "Default options should not warn"
+        EnSyncGrpclibClient("localhost:50051", {"compression": "gzip", "channelOptions": {"grpc.http2.bdp_probe": 0}})
+        assert len(records) == 2, "Ignored grpcio options should each log a warning"
+    finally:
+        grpc_logger.removeHandler(handler)
+        grpc_logger.setLevel(level)
+    
+    print("✅ The grpclib transport caches stub methods and warns about ignored options!")
+    return True
+
+
 async def main():
     """Run all tests."""
     print("=" * 60)
@@ -79,6 +432,18 @@ async def main():
     try:
         await test_close_method()
         await test_pythonic_naming()
+        await test_publish_batch()
+        await test_channel_pool()
+        await test_session_reuse()
+        await test_batched_delivery()
+        await test_recipient_key_cache()
+        await test_prepare_publish()
+        await test_get_engine()
+        await test_decryption_key_cache()
+        await test_get_engine_after_close()
+        await test_payload_serialization()
+        await test_handlers_get_own_payload()
+        await test_grpclib_transport()
         
         print("\n" + "=" * 60)
         print("🎉 SUCCESS: All fixes verified!")